@@ -3,12 +3,18 @@
 import logging
 from typing import List, Dict, Any
 import asyncio
+import inspect
+import json
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .samsungtvws.async_art import SamsungTVAsyncArt
+from .samsungtvws.thumbnail_cache import ThumbnailCache
+from .samsungtvws.upload_index import UploadIndex
+from .coordinator import FrameArtCoordinator
 from .const import (
     DOMAIN,
     CONF_HOST,
@@ -17,6 +23,9 @@ from .const import (
     DEFAULT_TIMEOUT,
     DEFAULT_PORT,
     SUPPORTED_PLATFORMS,
+    THUMBNAIL_CACHE_SIZE,
+    ENABLE_PUSH_UPDATES,
+    PUSH_EVENTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +42,14 @@ class FrameArtHub:
         self._tv = None
         self._token_file = f"{DOMAIN}_{self.host.replace('.', '_')}_token.txt"
         self._timeout = config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+        self.coordinator = FrameArtCoordinator(hass, self)
+        self.thumbnail_cache = ThumbnailCache(
+            hass.config.path(DOMAIN, "thumbnails", self.host.replace(".", "_")),
+            max_bytes=THUMBNAIL_CACHE_SIZE,
+        )
+        self.upload_index = UploadIndex(
+            hass.config.path(DOMAIN, "uploads", f"{self.host.replace('.', '_')}.json")
+        )
 
     async def async_initialize(self) -> None:
         """Initialize the TV connection."""
@@ -43,15 +60,41 @@ class FrameArtHub:
                 timeout=self._timeout,
                 port=DEFAULT_PORT,
                 token_file=self._token_file,
+                thumbnail_cache=self.thumbnail_cache,
+                upload_index=self.upload_index,
+                session=async_get_clientsession(self.hass),
             )
             await self._tv.initialize()
             _LOGGER.info("TV initialized at %s", self.host)
+            if ENABLE_PUSH_UPDATES:
+                for event in PUSH_EVENTS:
+                    self._tv.set_callback(event, self._handle_push_event)
+            self._tv.set_connection_callback(
+                self.coordinator.async_handle_connection_change
+            )
             await self._tv.start_listening()
             _LOGGER.info("Started listening to TV at %s", self.host)
+            self._tv.start_supervisor()
         except Exception as e:
             _LOGGER.error("Failed to initialize TV connection for %s: %s", self.host, e)
             self._tv = None
 
+    def _handle_push_event(self, event, response) -> None:
+        """Forward an art channel event to the coordinator."""
+        try:
+            data = json.loads(response["data"])
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.debug("Ignoring malformed event from %s: %s", self.host, e)
+            return
+        self.coordinator.async_handle_push_event(data)
+
+    async def async_shutdown(self) -> None:
+        """Stop the connection supervisor and close the TV connection."""
+        if self._tv:
+            await self._tv.stop_supervisor()
+            await self._tv.close()
+            self._tv = None
+
     async def ex(self, callback) -> Any:
         """
         Execute a callback after ensuring the TV is initialized.
@@ -77,8 +120,10 @@ class FrameArtHub:
         try:
             if asyncio.iscoroutinefunction(callback):
                 return await callback()
-            else:
-                return callback()
+            result = callback()
+            if inspect.isawaitable(result):
+                return await result
+            return result
         except Exception as e:
             _LOGGER.error("Error executing callback for TV at %s: %s", self.host, e)
             return None
@@ -118,6 +163,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hub = FrameArtHub(hass, entry.data)
     await hub.async_initialize()
 
+    # Fetch the first shared state snapshot before entities are added
+    await hub.coordinator.async_refresh()
+
     # Store the hub in hass.data
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub
 
@@ -143,6 +191,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hub = hass.data[DOMAIN].pop(entry.entry_id, None)
         if hub:
             _LOGGER.info("Shutting down connection to TV at %s", hub.host)
+            await hub.async_shutdown()
 
     # Clean up if no hubs remain
     if not hass.data[DOMAIN]:
@@ -8,6 +8,20 @@ CONFIG_ENTRY_KEY = "hubs"
 
 DEFAULT_TIMEOUT = 10.0
 DEFAULT_PORT = 8002
+DEFAULT_SCAN_INTERVAL = 30
+THUMBNAIL_CACHE_SIZE = 50 * 1024 * 1024
+
+# With push updates enabled, polling only reconciles state missed while the
+# art channel was disconnected.
+ENABLE_PUSH_UPDATES = True
+PUSH_FALLBACK_SCAN_INTERVAL = 300
+PUSH_EVENTS = [
+    "art_mode_changed",
+    "artmode_status",
+    "go_to_standby",
+    "wakeup",
+    "image_selected",
+]
 
 ENABLE_SENSOR = False
 
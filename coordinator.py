@@ -0,0 +1,135 @@
+"""State coordinator for Samsung The Frame Art integration."""
+
+import logging
+from datetime import timedelta
+from typing import Any, Dict, TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    ENABLE_PUSH_UPDATES,
+    PUSH_FALLBACK_SCAN_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from . import FrameArtHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FrameArtCoordinator(DataUpdateCoordinator):
+    """Fetch one state snapshot per interval and share it with all entities."""
+
+    def __init__(self, hass: HomeAssistant, hub: "FrameArtHub") -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{hub.host}",
+            update_interval=timedelta(
+                seconds=PUSH_FALLBACK_SCAN_INTERVAL
+                if ENABLE_PUSH_UPDATES
+                else DEFAULT_SCAN_INTERVAL
+            ),
+        )
+        self._hub = hub
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch the latest state snapshot from the TV."""
+        hub = self._hub
+        is_alive = bool(await hub.ex(lambda: hub._tv.is_alive()))
+        snapshot = _empty_snapshot(is_alive)
+        if not is_alive:
+            return snapshot
+
+        bundle = await hub.ex(lambda: hub._tv.get_state_bundle())
+        if not bundle:
+            return snapshot
+
+        snapshot["art_mode_status"] = bundle["artmode"]
+        brightness_info = bundle["brightness"]
+        color_temp_info = bundle["color_temperature"]
+        slideshow_info = bundle["slideshow_status"]
+        current_image = bundle["current"]
+
+        snapshot["brightness_level"] = _parse_int(brightness_info, scale=10)
+        snapshot["color_temperature"] = _parse_int(color_temp_info)
+        snapshot["slideshow_status"] = (
+            slideshow_info.get("value") if slideshow_info else None
+        )
+        snapshot["current_image"] = (
+            current_image.get("content_id") if current_image else None
+        )
+        return snapshot
+
+    @callback
+    def async_handle_push_event(self, data: Dict[str, Any]) -> None:
+        """Patch the current snapshot from an art channel event."""
+        sub_event = data.get("event", "*")
+        _LOGGER.debug("Push event %s from %s", sub_event, self._hub.host)
+
+        if sub_event == "wakeup":
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        if not self.data or not self.data["available"]:
+            # Nothing to patch yet, fetch a full snapshot instead
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        # Patch in place and notify listeners without async_set_updated_data,
+        # which would push back the fallback poll that reconciles the values
+        # (brightness, colour temperature, slideshow) that are never pushed
+        snapshot = self.data
+        if sub_event == "art_mode_changed":
+            snapshot["art_mode_status"] = data.get("status")
+        elif sub_event == "artmode_status":
+            snapshot["art_mode_status"] = data.get("value")
+        elif sub_event == "go_to_standby":
+            snapshot["art_mode_status"] = "off"
+        elif sub_event == "image_selected":
+            snapshot["current_image"] = data.get("content_id")
+        else:
+            return
+        self.async_update_listeners()
+
+    @callback
+    def async_handle_connection_change(self, connected: bool) -> None:
+        """Reflect an art channel drop or reconnect without waiting for a poll."""
+        _LOGGER.debug(
+            "Art channel to %s %s",
+            self._hub.host,
+            "reconnected" if connected else "dropped",
+        )
+        if connected or not self.data:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        self.data.update(_empty_snapshot(False))
+        self.async_update_listeners()
+
+
+def _empty_snapshot(is_alive: bool) -> Dict[str, Any]:
+    """Return a snapshot with every sensor value unset."""
+    return {
+        "available": is_alive,
+        "connection_status": "Connected" if is_alive else "Disconnected",
+        "art_mode_status": None,
+        "brightness_level": None,
+        "color_temperature": None,
+        "slideshow_status": None,
+        "current_image": None,
+    }
+
+
+def _parse_int(info, scale: int = 1):
+    """Parse the integer 'value' of a settings item, or None."""
+    if not info:
+        return None
+    try:
+        return int(info.get("value", 0)) * scale
+    except (ValueError, TypeError):
+        _LOGGER.warning("Could not parse value from: %s", info)
+        return None
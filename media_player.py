@@ -1,4 +1,5 @@
 import logging
+import mimetypes
 from typing import Optional
 from functools import partial
 import voluptuous as vol
@@ -8,7 +9,8 @@ from homeassistant.components.media_player import (
     MediaPlayerEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import (
     STATE_ON,
     STATE_OFF,
@@ -51,11 +53,12 @@ async def async_setup_entry(
     )
 
 
-class FrameArtMediaPlayer(MediaPlayerEntity):
+class FrameArtMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     """Frame Art Media Player."""
 
     def __init__(self, hub: FrameArtHub) -> None:
         """Initialize the media player."""
+        super().__init__(hub.coordinator)
         self._hub = hub
         self._attr_name = f"{hub.name} Frame"
         self._attr_unique_id = f"{hub.name}_frame".replace(".", "_")
@@ -66,6 +69,12 @@ class FrameArtMediaPlayer(MediaPlayerEntity):
         self._attr_available = False
         self._state = None
         self._attributes = {}
+        self._update_from_snapshot()
+
+    @property
+    def available(self) -> bool:
+        """Return True if the TV is reachable."""
+        return self._attr_available
 
     @property
     def state(self):
@@ -85,60 +94,64 @@ class FrameArtMediaPlayer(MediaPlayerEntity):
         """Return entity specific state attributes."""
         return self._attributes
 
+    @property
+    def media_image_hash(self) -> Optional[str]:
+        """Return a hash of the current artwork, its content id."""
+        return self._attributes.get("current_image")
+
+    async def async_get_media_image(self):
+        """Return the thumbnail of the current artwork, served from the cache."""
+        content_id = self._attributes.get("current_image")
+        if not content_id:
+            return None, None
+        thumbnails = await self._hub.ex(
+            partial(self._hub._tv.get_thumbnail, content_id, as_dict=True)
+        )
+        if not thumbnails:
+            return None, None
+        filename, data = next(iter(thumbnails.items()))
+        return bytes(data), mimetypes.guess_type(filename)[0]
+
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
         await self._hub.ex(partial(self._hub._tv.set_artmode, "on"))
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
         await self._hub.ex(partial(self._hub._tv.set_artmode, "off"))
-
-    async def async_update(self) -> None:
-        """Fetch new state data for this device."""
-        try:
-            # Check if TV is available
-            is_alive = await self._hub.ex(self._hub._tv.is_alive)
-            self._attr_available = is_alive
-
-            if not self._attr_available:
-                return
-
-            # Update art mode status
-            self._state = await self._hub.ex(self._hub._tv.get_artmode)
-
-            # Update attributes
-            brightness_info = await self._hub.ex(self._hub._tv.get_brightness)
-            color_temp_info = await self._hub.ex(self._hub._tv.get_color_temperature)
-            slideshow_info = await self._hub.ex(self._hub._tv.get_slideshow_status)
-            current_image = await self._hub.ex(self._hub._tv.get_current)
-
-            self._attributes = {
-                "art_mode_status": self._state,
-                "brightness_level": int(brightness_info.get("value", 0)) * 10
-                if brightness_info
-                else None,
-                "color_temperature": int(color_temp_info.get("value", 0))
-                if color_temp_info
-                else None,
-                "slideshow_status": slideshow_info.get("value")
-                if slideshow_info
-                else None,
-                "current_image": current_image.get("content_id")
-                if current_image
-                else None,
-                "connection_status": "Connected" if is_alive else "Disconnected",
-            }
-
-        except Exception as e:
-            _LOGGER.error("Error updating media player: %s", str(e))
+        await self.coordinator.async_request_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a new state snapshot from the coordinator."""
+        self._update_from_snapshot()
+        super()._handle_coordinator_update()
+
+    def _update_from_snapshot(self) -> None:
+        """Copy the shared state snapshot into the entity."""
+        snapshot = self.coordinator.data
+        if not snapshot:
             self._attr_available = False
+            return
+
+        self._attr_available = snapshot["available"]
+        if not self._attr_available:
+            return
+
+        self._state = snapshot["art_mode_status"]
+        self._attributes = {
+            key: value for key, value in snapshot.items() if key != "available"
+        }
 
     async def async_set_brightness(self, brightness: int) -> None:
         """Set the brightness of the TV."""
         await self._hub.ex(partial(self._hub._tv.set_brightness, brightness / 10))
+        await self.coordinator.async_request_refresh()
 
     async def async_set_color_temperature(self, color_temperature: int) -> None:
         """Set the color temperature of the TV."""
         await self._hub.ex(
             partial(self._hub._tv.set_color_temperature, color_temperature)
         )
+        await self.coordinator.async_request_refresh()
@@ -8,13 +8,17 @@ Copyright (C) 2024 Nick Waterton <n.waterton@outlook.com>
 SPDX-License-Identifier: LGPL-3.0
 """
 
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
 import os
 import json
 import logging
 import random
 import socket
-from typing import Any, Dict, List, Optional, Union
+import ssl
+import threading
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 import uuid
 
 import websocket
@@ -23,12 +27,15 @@ from . import exceptions, helper
 from .command import SamsungTVCommand
 from .connection import SamsungTVWSConnection
 from .event import D2D_SERVICE_MESSAGE_EVENT, MS_CHANNEL_READY_EVENT
+from .async_upload import UPLOAD_CHUNK_SIZE
 from .rest import SamsungTVRest
 from .helper import get_ssl_context
 
 _LOGGING = logging.getLogger(__name__)
 
 ART_ENDPOINT = "com.samsung.art-app"
+# sendfile is called per chunk only so that progress can be reported
+SENDFILE_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 class ArtChannelEmitCommand(SamsungTVCommand):
@@ -46,6 +53,139 @@ class ArtChannelEmitCommand(SamsungTVCommand):
         )
 
 
+class D2DFrameReader:
+    """
+    Reads D2D frames (4 byte big-endian header length, JSON header, payload)
+    from a transfer socket.
+
+    recv can return fewer bytes than asked for, so every field is read to its
+    exact length with recv_into, straight into a buffer allocated once at its
+    final size.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self._length = bytearray(4)
+
+    def read_into(self, view: memoryview) -> None:
+        received = 0
+        while received < len(view):
+            count = self.sock.recv_into(view[received:])
+            if not count:
+                raise exceptions.ConnectionFailure(
+                    "D2D socket closed after {} of {} bytes".format(received, len(view))
+                )
+            received += count
+
+    def read_exact(self, size: int) -> bytearray:
+        buffer = bytearray(size)
+        self.read_into(memoryview(buffer))
+        return buffer
+
+    def read_frame(self) -> Tuple[Dict[str, Any], bytearray]:
+        """Return (header, payload) of the next frame."""
+        self.read_into(memoryview(self._length))
+        header = json.loads(self.read_exact(int.from_bytes(self._length, "big")))
+        return header, self.read_exact(int(header["fileLength"]))
+
+
+class PendingArtResponses:
+    """
+    Thread-safe table of in-flight art requests, filled by the reader thread.
+
+    Responses are matched by request id. Callers waiting for a named event
+    (eg 'image_added') are queued per event and served in FIFO order,
+    preferring a waiter whose request id matches the event.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests: Dict[str, "Future[Dict[str, Any]]"] = {}
+        self._events: Dict[
+            str, Deque[Tuple[Optional[str], "Future[Dict[str, Any]]"]]
+        ] = {}
+
+    def add(self, request_id: str) -> "Future[Dict[str, Any]]":
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lock:
+            self._requests[request_id] = future
+        return future
+
+    def add_event(
+        self, event: str, request_id: Optional[str] = None
+    ) -> "Future[Dict[str, Any]]":
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lock:
+            self._events.setdefault(event, deque()).append((request_id, future))
+        return future
+
+    def resolve(
+        self, request_id: Optional[str], sub_event: str, data: Dict[str, Any]
+    ) -> bool:
+        """Hand data to the waiter it belongs to, returns True if one was found"""
+        with self._lock:
+            future = self._requests.pop(request_id, None) if request_id else None
+            if future is None:
+                if sub_event == "error":
+                    # an error carries the request id of the event waiter that failed
+                    queues = list(self._events.values())
+                else:
+                    queues = [self._events.get(sub_event, deque())]
+                for waiters in queues:
+                    future = self._pop_waiter(
+                        waiters, request_id, fifo=sub_event != "error"
+                    )
+                    if future:
+                        break
+        if future is None or future.done():
+            return False
+        future.set_result(data)
+        return True
+
+    @staticmethod
+    def _pop_waiter(
+        waiters: Deque[Tuple[Optional[str], "Future[Dict[str, Any]]"]],
+        request_id: Optional[str],
+        fifo: bool,
+    ) -> Optional["Future[Dict[str, Any]]"]:
+        chosen = next(
+            (waiter for waiter in waiters if request_id and waiter[0] == request_id),
+            waiters[0] if waiters and fifo else None,
+        )
+        if chosen is None:
+            return None
+        waiters.remove(chosen)
+        return chosen[1]
+
+    def discard(self, future: "Future[Dict[str, Any]]") -> None:
+        """Remove future from the table, wherever it is registered."""
+        with self._lock:
+            for request_id, pending in list(self._requests.items()):
+                if pending is future:
+                    del self._requests[request_id]
+                    return
+            for event, waiters in list(self._events.items()):
+                for waiter in waiters:
+                    if waiter[1] is future:
+                        waiters.remove(waiter)
+                        if not waiters:
+                            del self._events[event]
+                        return
+
+    def fail_all(self, error: Exception) -> None:
+        """Wake every waiter with error, eg when the connection is lost."""
+        with self._lock:
+            futures = list(self._requests.values())
+            futures += [
+                future for waiters in self._events.values() for _, future in waiters
+            ]
+            self._requests.clear()
+            self._events.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+
 class SamsungTVArt(SamsungTVWSConnection):
     def __init__(
         self,
@@ -69,7 +209,12 @@ class SamsungTVArt(SamsungTVWSConnection):
         )
         self.art_uuid = str(uuid.uuid4())
         self._rest_api: Optional[SamsungTVRest] = None
-        self.pending_requests = None
+        self.pending_requests = PendingArtResponses()
+        self.callbacks: Dict[str, Callable[[str, Dict[str, Any]], None]] = {}
+        self._reader: Optional[threading.Thread] = None
+        self._reader_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._transfer_lock = threading.Lock()
 
     def open(self) -> websocket.WebSocket:
         super().open()
@@ -86,40 +231,129 @@ class SamsungTVArt(SamsungTVWSConnection):
             raise exceptions.ConnectionFailure(response)
 
         return self.connection
-        
+
+    def close(self) -> None:
+        reader = self._reader
+        super().close()
+        if reader and reader is not threading.current_thread():
+            reader.join()
+        self._reader = None
+        self.pending_requests.fail_all(
+            exceptions.ConnectionFailure("Art channel closed")
+        )
+        if self._rest_api:
+            self._rest_api.close()
+
+    def _ensure_reader(self) -> None:
+        """Open the art channel and start the reader thread if not running."""
+        with self._reader_lock:
+            if self._reader and self._reader.is_alive() and self.connection:
+                return
+            if self.connection is None:
+                self.open()
+            self._reader = threading.Thread(
+                target=self._read_loop,
+                args=(self.connection,),
+                name="SamsungTVArt reader",
+                daemon=True,
+            )
+            self._reader.start()
+
+    def _read_loop(self, connection: websocket.WebSocket) -> None:
+        """
+        Read every message off the art channel and route art responses to the
+        waiters in pending_requests, so concurrent requests from several threads
+        each get their own reply. Events are also passed to the callback
+        registered for them with set_callback, on this thread
+        """
+        try:
+            while True:
+                try:
+                    raw_data = connection.recv()
+                except websocket.WebSocketTimeoutException:
+                    continue
+                except Exception as e:
+                    _LOGGING.debug("Art channel reader stopped: %s", str(e))
+                    break
+                if not raw_data:
+                    break
+                try:
+                    response = helper.process_api_response(raw_data)
+                    event = response.get("event", "*")
+                    self._websocket_event(event, response)
+                    if event != D2D_SERVICE_MESSAGE_EVENT:
+                        continue
+                    data = json.loads(response["data"])
+                    sub_event = data.get("event", "*")
+                    request_id = data.get("request_id", data.get("id"))
+                except Exception as e:
+                    _LOGGING.debug("Ignoring malformed art channel message: %s", e)
+                    continue
+                callback = self.callbacks.get(sub_event)
+                if callback:
+                    try:
+                        callback(event, response)
+                    except Exception:
+                        _LOGGING.exception("Error in %s callback", sub_event)
+                if (
+                    not self.pending_requests.resolve(request_id, sub_event, data)
+                    and not callback
+                ):
+                    _LOGGING.debug("Unsolicited art event: %s", sub_event)
+        finally:
+            # Fail the waiters before releasing the lock, so none registered
+            # against a connection reopened meanwhile are failed by mistake
+            with self._reader_lock:
+                if self.connection is None or self.connection is connection:
+                    self.connection = None
+                    self.pending_requests.fail_all(
+                        exceptions.ConnectionFailure("Art channel closed")
+                    )
+
     def get_uuid(self):
         self.art_uuid = str(uuid.uuid4())
         return self.art_uuid
         
-    def get_websocket_message(self):
+    def set_callback(self, trigger, callback=None):
+        """
+        Call callback(event, response) for each art channel event named
+        trigger (eg 'image_selected') that arrives while the reader is running
+        """
+        if not callback:
+            self.callbacks.pop(trigger, None)
+        else:
+            self.callbacks[trigger] = callback
+
+    def _register(self, wait_for_event, request_uuid=None):
+        self._ensure_reader()
+        if wait_for_event:
+            return self.pending_requests.add_event(wait_for_event, request_uuid)
+        return self.pending_requests.add(request_uuid)
+
+    def wait_for_response(self, wait_for_event, request_uuid=None, future=None):
+        """
+        Wait for the reply registered as future, or else for the next
+        wait_for_event (or the response to request_uuid if no event is given)
+        """
+        if future is None:
+            future = self._register(wait_for_event, request_uuid)
         try:
-            raw_data = self.connection.recv()
-            response = helper.process_api_response(raw_data)
-            event = response.get("event", "*")
-            self._websocket_event(event, response)
-            _LOGGING.debug('event: {}'.format(event))
-            if event == D2D_SERVICE_MESSAGE_EVENT:
-                return json.loads(response["data"])
-        except websocket.WebSocketTimeoutException as e:
-            raise exceptions.TimeoutError('Websocket Time out: {}'.format(e))
-        return {}
-        
-    def wait_for_response(self, wait_for_event, request_uuid=None):
-        while True:
-            data = self.get_websocket_message()
-            _LOGGING.debug('request_uuid: {}, message uuid: {}'.format(request_uuid, data.get('request_id', data.get('id'))))
-            if data.get('request_id', data.get('id')) == request_uuid:
-                sub_event = data.get("event", "*")
-                _LOGGING.debug('sub_event: {}, wait_for_event: {}'.format(sub_event, wait_for_event))
-                if sub_event == "error":
-                    raise exceptions.ResponseError(
-                        f"{json.loads(data['request_data'])['request']} request failed "
-                        f"with error number {data['error_code']}"
-                    )
-                # Check sub event, return if found or not defined
-                if not wait_for_event or sub_event == wait_for_event:
-                    return data
-        return None
+            data = future.result(self.timeout)
+        except FutureTimeoutError:
+            raise exceptions.TimeoutError(
+                "Websocket Time out waiting for {}".format(
+                    wait_for_event or request_uuid
+                )
+            )
+        finally:
+            self.pending_requests.discard(future)
+        _LOGGING.debug('request_uuid: {}, sub_event: {}'.format(request_uuid, data.get("event", "*")))
+        if data.get("event", "*") == "error":
+            raise exceptions.ResponseError(
+                f"{json.loads(data['request_data'])['request']} request failed "
+                f"with error number {data['error_code']}"
+            )
+        return data
 
     def _send_art_request(
         self,
@@ -129,8 +363,18 @@ class SamsungTVArt(SamsungTVWSConnection):
         if not request_data.get("id"):
             request_data["id"] = self.get_uuid()            #old api
         request_data["request_id"] = request_data["id"]     #new api  
-        self.send_command(ArtChannelEmitCommand.art_app_request(request_data))
-        return self.wait_for_response(wait_for_event, request_data["id"])
+        # Register before sending, the reader thread may see the reply at once
+        future = self._register(wait_for_event, request_data["id"])
+        try:
+            with self._send_lock:
+                self.send_command(
+                    ArtChannelEmitCommand.art_app_request(request_data),
+                    key_press_delay=0,
+                )
+        except BaseException:
+            self.pending_requests.discard(future)
+            raise
+        return self.wait_for_response(wait_for_event, request_data["id"], future=future)
 
     def _get_rest_api(self) -> SamsungTVRest:
         if self._rest_api is None:
@@ -138,8 +382,7 @@ class SamsungTVArt(SamsungTVWSConnection):
         return self._rest_api
 
     def supported(self) -> bool:
-        data = self._get_rest_api().rest_device_info()
-        return data.get("device", {}).get("FrameTVSupport") == "true"
+        return self._get_rest_api().rest_frame_tv_support()
 
     def get_api_version(self):
         try:
@@ -289,26 +532,26 @@ class SamsungTVArt(SamsungTVWSConnection):
         )
         assert data
         conn_info = json.loads(data["conn_info"])
-        art_socket_raw = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        art_socket = get_ssl_context().wrap_socket(art_socket_raw) if conn_info.get('secured', False) else art_socket_raw
-        art_socket.connect((conn_info["ip"], int(conn_info["port"])))
         total_num_thumbnails = 1
         current_thumb = -1
         thumbnail_data_dict = {}
-        while current_thumb+1 < total_num_thumbnails:
-            header_len = int.from_bytes(art_socket.recv(4), "big")
-            header = json.loads(art_socket.recv(header_len))
-            thumbnail_data_len = int(header["fileLength"])
-            current_thumb = int(header["num"])
-            total_num_thumbnails = int(header["total"])
-            filename = "{}.{}".format(header["fileID"], header["fileType"])
-            thumbnail_data = bytearray()
-            while len(thumbnail_data) < thumbnail_data_len:
-                packet = art_socket.recv(thumbnail_data_len - len(thumbnail_data))
-                thumbnail_data.extend(packet)
-            thumbnail_data_dict[filename]=thumbnail_data
+        with self._connect_d2d(conn_info) as art_socket:
+            reader = D2DFrameReader(art_socket)
+            while current_thumb+1 < total_num_thumbnails:
+                header, thumbnail_data = reader.read_frame()
+                current_thumb = int(header["num"])
+                total_num_thumbnails = int(header["total"])
+                filename = "{}.{}".format(header["fileID"], header["fileType"])
+                thumbnail_data_dict[filename]=thumbnail_data
         return thumbnail_data_dict
 
+    @staticmethod
+    def _connect_d2d(conn_info: Dict[str, Any]) -> socket.socket:
+        art_socket_raw = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        art_socket = get_ssl_context().wrap_socket(art_socket_raw) if conn_info.get('secured', False) else art_socket_raw
+        art_socket.connect((conn_info["ip"], int(conn_info["port"])))
+        return art_socket
+
     def get_thumbnail(self, content_id_list=[], as_dict=False):
         if isinstance(content_id_list, str):
             content_id_list=[content_id_list]
@@ -329,29 +572,27 @@ class SamsungTVArt(SamsungTVWSConnection):
             assert data
             conn_info = json.loads(data["conn_info"])
 
-            art_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            art_socket.connect((conn_info["ip"], int(conn_info["port"])))
-            header_len = int.from_bytes(art_socket.recv(4), "big")
-            header = json.loads(art_socket.recv(header_len))
-
-            thumbnail_data_len = int(header["fileLength"])
-            thumbnail_data = bytearray()
-            while len(thumbnail_data) < thumbnail_data_len:
-                packet = art_socket.recv(thumbnail_data_len - len(thumbnail_data))
-                thumbnail_data.extend(packet)
+            with self._connect_d2d(conn_info) as art_socket:
+                header, thumbnail_data = D2DFrameReader(art_socket).read_frame()
             filename = "{}.{}".format(header["fileID"], header["fileType"])
             thumbnail_data_dict[filename] = thumbnail_data
 
         return thumbnail_data_dict if as_dict else list(thumbnail_data_dict.values()) if len(content_id_list) > 1 else thumbnail_data
 
-    def upload(self, file, matte="shadowbox_polar", portrait_matte="shadowbox_polar", file_type="png", date=None):
+    def upload(self, file, matte="shadowbox_polar", portrait_matte="shadowbox_polar", file_type="png", date=None, progress=None):
+        '''
+        file is a path or bytes. Paths are streamed from disk (with sendfile when
+        the transfer socket is not secured) rather than read into memory
+        progress(sent, total) is called as the image is sent
+        '''
+        path = None
         if isinstance(file, str):
+            path = file
             file_name, file_extension = os.path.splitext(file)
             file_type = file_extension[1:]
-            with open(file, 'rb') as f:
-                file = f.read()
-                
-        file_size = len(file)
+            file_size = os.path.getsize(path)
+        else:
+            file_size = len(file)
         file_type = file_type.lower()
         if file_type == "jpeg":
             file_type = "jpg"
@@ -391,17 +632,66 @@ class SamsungTVArt(SamsungTVWSConnection):
             }
         )
 
-        art_socket_raw = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        art_socket = get_ssl_context().wrap_socket(art_socket_raw) if conn_info.get('secured', False) else art_socket_raw  
-        art_socket.connect((conn_info["ip"], int(conn_info["port"])))
-        art_socket.send(len(header).to_bytes(4, "big"))
-        art_socket.send(header.encode("ascii"))
-        art_socket.send(file)
-        #_LOGGING.info('sending: header length: {}, header: {}'.format(len(header).to_bytes(4, "big").hex(), header.encode("ascii")))
-
-        data = self.wait_for_response("image_added")
+        # image_added does not say which upload it belongs to, so transfers
+        # run one at a time, and the waiter is queued before sending
+        with self._transfer_lock:
+            image_added = self._register("image_added")
+            try:
+                with self._connect_d2d(conn_info) as art_socket:
+                    art_socket.sendall(len(header).to_bytes(4, "big"))
+                    art_socket.sendall(header.encode("ascii"))
+                    #_LOGGING.info('sending: header length: {}, header: {}'.format(len(header).to_bytes(4, "big").hex(), header.encode("ascii")))
+                    if path:
+                        with open(path, "rb") as f:
+                            sent = self._send_file(art_socket, f, file_size, progress)
+                    else:
+                        sent = self._send_bytes(art_socket, file, progress)
+                if sent != file_size:
+                    raise ValueError(
+                        "Sent {} of {} bytes of {}".format(
+                            sent, file_size, path or "image"
+                        )
+                    )
+            except BaseException:
+                self.pending_requests.discard(image_added)
+                raise
+            data = self.wait_for_response("image_added", future=image_added)
         return data["content_id"] if data else None
 
+    @staticmethod
+    def _send_file(art_socket, f, file_size, progress=None):
+        """
+        Send f from disk; over plain TCP the kernel copies it with sendfile,
+        under TLS it is sent in UPLOAD_CHUNK_SIZE pieces
+        """
+        sent = 0
+        if isinstance(art_socket, ssl.SSLSocket):
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                art_socket.sendall(chunk)
+                sent += len(chunk)
+                if progress:
+                    progress(sent, file_size)
+            return sent
+        while sent < file_size:
+            count = art_socket.sendfile(
+                f, sent, min(SENDFILE_CHUNK_SIZE, file_size - sent)
+            )
+            if not count:
+                break
+            sent += count
+            if progress:
+                progress(sent, file_size)
+        return sent
+
+    @staticmethod
+    def _send_bytes(art_socket, data, progress=None):
+        view = memoryview(data)
+        for offset in range(0, len(view), UPLOAD_CHUNK_SIZE):
+            art_socket.sendall(view[offset : offset + UPLOAD_CHUNK_SIZE])
+            if progress:
+                progress(min(offset + UPLOAD_CHUNK_SIZE, len(view)), len(view))
+        return len(view)
+
     def delete(self, content_id):
         return self.delete_list([content_id])
 
@@ -0,0 +1,109 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+_LOGGING = logging.getLogger(__name__)
+
+MY_PICTURES_CATEGORY = "MY-C0002"
+FAVOURITES_CATEGORY = "MY-C0004"
+
+
+class ArtCatalog:
+    """
+    Local copy of the TV's content list, indexed by content_id and category.
+
+    Loaded once from get_content_list and then patched from the art channel
+    'image_added', 'image_deleted' and 'favorite_changed' events, so lookups
+    never touch the network.
+    """
+
+    def __init__(self) -> None:
+        self.loaded = False
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_category: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, content_id: object) -> bool:
+        return content_id in self._by_id
+
+    def load(self, content_list: Iterable[Dict[str, Any]]) -> None:
+        self._by_id.clear()
+        self._by_category.clear()
+        for item in content_list:
+            self.add(item)
+        self.loaded = True
+        _LOGGING.debug("Loaded %d items into art catalog", len(self._by_id))
+
+    def invalidate(self) -> None:
+        """Mark the catalog stale, eg after events may have been missed."""
+        self.loaded = False
+
+    def get(self, content_id: str) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(content_id)
+
+    def items(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        if category:
+            return list(self._by_category.get(category, {}).values())
+        return [
+            item
+            for category_items in self._by_category.values()
+            for item in category_items.values()
+        ]
+
+    def add(self, item: Dict[str, Any]) -> None:
+        content_id = item["content_id"]
+        category = item.get("category_id")
+        self._by_category.setdefault(category, {})[content_id] = item
+        if content_id not in self._by_id or category != FAVOURITES_CATEGORY:
+            self._by_id[content_id] = item
+
+    def remove(self, content_id: str) -> None:
+        self._by_id.pop(content_id, None)
+        for category_items in self._by_category.values():
+            category_items.pop(content_id, None)
+
+    def set_favourite(self, content_id: str, status: str = "on") -> None:
+        favourites = self._by_category.setdefault(FAVOURITES_CATEGORY, {})
+        if status != "on":
+            favourites.pop(content_id, None)
+            return
+        item = self._by_id.get(content_id, {"content_id": content_id})
+        favourites[content_id] = dict(item, category_id=FAVOURITES_CATEGORY)
+
+    def apply_event(self, sub_event: str, data: Dict[str, Any]) -> None:
+        """Patch the catalog from an art channel D2D event."""
+        if not self.loaded:
+            return
+        if sub_event == "image_added" and data.get("content_id"):
+            item = {
+                key: value
+                for key, value in data.items()
+                if key not in ("event", "id", "request_id", "target_client_id")
+            }
+            item.setdefault("category_id", MY_PICTURES_CATEGORY)
+            self.add(item)
+        elif sub_event == "image_deleted":
+            for content_id in self.event_content_ids(data):
+                self.remove(content_id)
+        elif sub_event == "favorite_changed" and data.get("content_id"):
+            self.set_favourite(data["content_id"], data.get("status", "on"))
+
+    @staticmethod
+    def event_content_ids(data: Dict[str, Any]) -> List[str]:
+        """Return the content ids an event refers to."""
+        if data.get("content_id"):
+            return [data["content_id"]]
+        content_id_list = data.get("content_id_list", [])
+        if isinstance(content_id_list, str):
+            content_id_list = json.loads(content_id_list)
+        return [item["content_id"] for item in content_id_list]
@@ -14,22 +14,61 @@ import os
 import json
 import logging
 import random
+import inspect
+import time
 import asyncio
+import contextlib
 import aiohttp
-from typing import Any, Dict, List, Optional, Union, Callable, Awaitable
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union, Callable, Awaitable
 import uuid
 
+from websockets.exceptions import ConnectionClosed
+
 from . import exceptions, helper
 from .command import SamsungTVCommand
 from .async_connection import SamsungTVWSAsyncConnection
 from .async_remote import SamsungTVWSAsyncRemote
 from .event import D2D_SERVICE_MESSAGE_EVENT, MS_CHANNEL_READY_EVENT
 from .async_rest import SamsungTVAsyncRest
+from .art_catalog import ArtCatalog
+from .async_upload import UPLOAD_CHUNK_SIZE, BulkUploader, UploadSource
+from .folder_sync import FolderSync
+from .upload_index import content_hash
 from .helper import get_ssl_context
 
 _LOGGING = logging.getLogger(__name__)
 
 ART_ENDPOINT = "com.samsung.art-app"
+THUMBNAIL_CHUNK_SIZE = 20
+D2D_CHUNK_SIZE = 64 * 1024
+REST_CONNECTION_LIMIT = 4
+REST_KEEPALIVE_TIMEOUT = 60
+# Read-only requests whose concurrent duplicates can share one round trip
+COALESCE_REQUESTS = frozenset(
+    (
+        "api_version",
+        "get_api_version",
+        "get_artmode_settings",
+        "get_artmode_status",
+        "get_auto_rotation_status",
+        "get_color_temperature",
+        "get_content_list",
+        "get_current_artwork",
+        "get_current_rotation",
+        "get_device_info",
+        "get_matte_list",
+        "get_photo_filter_list",
+        "get_slideshow_status",
+    )
+)
+ARTMODE_SETTINGS = (
+    "brightness",
+    "color_temperature",
+    "motion_sensitivity",
+    "motion_timer",
+    "brightness_sensor_setting",
+)
 
 
 class ArtChannelEmitCommand(SamsungTVCommand):
@@ -47,6 +86,156 @@ class ArtChannelEmitCommand(SamsungTVCommand):
         )
 
 
+class PendingArtRequests:
+    """
+    Table of in-flight art requests.
+
+    Responses are matched by request id. Callers waiting for a named event
+    (eg 'favorite_changed' or 'image_added') are queued per event and served
+    in FIFO order, preferring a waiter whose request id matches the event.
+    Entries that outlive their timeout (plus grace) are swept out.
+    """
+
+    def __init__(self, grace: float = 5) -> None:
+        self.grace = grace
+        self._requests: Dict[str, Tuple["asyncio.Future[Any]", float]] = {}
+        self._events: Dict[
+            str, Deque[Tuple[Optional[str], "asyncio.Future[Any]", float]]
+        ] = {}
+
+    def __len__(self) -> int:
+        pending = [future for future, _ in self._requests.values()]
+        pending += [future for queue in self._events.values() for _, future, _ in queue]
+        return sum(1 for future in pending if not future.done())
+
+    def _deadline(self, timeout: Optional[float]) -> float:
+        if timeout is None:
+            return float("inf")
+        return time.monotonic() + timeout + self.grace
+
+    def add(
+        self, request_id: str, timeout: Optional[float] = None
+    ) -> "asyncio.Future[Any]":
+        """Register a waiter for the response to request_id."""
+        self.sweep()
+        future = asyncio.get_running_loop().create_future()
+        self._requests[request_id] = (future, self._deadline(timeout))
+        return future
+
+    def add_event(
+        self,
+        event: str,
+        request_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> "asyncio.Future[Any]":
+        """Queue a waiter for the next occurrence of event."""
+        self.sweep()
+        future = asyncio.get_running_loop().create_future()
+        self._events.setdefault(event, deque()).append(
+            (request_id, future, self._deadline(timeout))
+        )
+        return future
+
+    def get(self, request_id: str) -> Optional["asyncio.Future[Any]"]:
+        entry = self._requests.get(request_id)
+        return entry[0] if entry else None
+
+    def resolve(
+        self, request_id: Optional[str], sub_event: str, response: Dict[str, Any]
+    ) -> bool:
+        """Hand response to the waiter it belongs to, returns True if one was found"""
+        entry = self._requests.pop(request_id, None) if request_id else None
+        if entry and not entry[0].done():
+            entry[0].set_result(response)
+            return True
+
+        if sub_event == "error":
+            # an error carries the request id of the event waiter that failed
+            queues = list(self._events.values())
+        else:
+            queues = [self._events.get(sub_event, deque())]
+        for waiters in queues:
+            future = self._pop_waiter(waiters, request_id, fifo=sub_event != "error")
+            if future:
+                future.set_result(response)
+                return True
+
+        # wait_for_response() may have been called with an event name
+        entry = self._requests.pop(sub_event, None)
+        if entry and not entry[0].done():
+            entry[0].set_result(response)
+            return True
+        return False
+
+    @staticmethod
+    def _pop_waiter(
+        waiters: Deque[Tuple[Optional[str], "asyncio.Future[Any]", float]],
+        request_id: Optional[str],
+        fifo: bool,
+    ) -> Optional["asyncio.Future[Any]"]:
+        live = [waiter for waiter in waiters if not waiter[1].done()]
+        chosen = next(
+            (waiter for waiter in live if request_id and waiter[0] == request_id),
+            live[0] if live and fifo else None,
+        )
+        if chosen is None:
+            return None
+        waiters.remove(chosen)
+        return chosen[1]
+
+    def discard(self, future: "asyncio.Future[Any]") -> None:
+        """Remove future from the table, wherever it is registered."""
+        for request_id, (pending, _) in list(self._requests.items()):
+            if pending is future:
+                del self._requests[request_id]
+                return
+        for event, waiters in list(self._events.items()):
+            for waiter in waiters:
+                if waiter[1] is future:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._events[event]
+                    return
+
+    def sweep(self) -> None:
+        """Drop completed entries and fail abandoned ones past their deadline."""
+        now = time.monotonic()
+        for request_id, (future, deadline) in list(self._requests.items()):
+            if future.done() or deadline < now:
+                if not future.done():
+                    _LOGGING.debug("Expiring abandoned request %s", request_id)
+                    self._fail(future, exceptions.ResponseTimeout(request_id))
+                del self._requests[request_id]
+        for event, waiters in list(self._events.items()):
+            for waiter in list(waiters):
+                _, future, deadline = waiter
+                if future.done() or deadline < now:
+                    if not future.done():
+                        _LOGGING.debug("Expiring abandoned wait for %s", event)
+                        self._fail(future, exceptions.ResponseTimeout(event))
+                    waiters.remove(waiter)
+            if not waiters:
+                del self._events[event]
+
+    def fail_all(self, error: Exception) -> None:
+        """Wake every waiter with error, eg when the connection is lost."""
+        for future, _ in self._requests.values():
+            if not future.done():
+                self._fail(future, error)
+        for waiters in self._events.values():
+            for _, future, _ in waiters:
+                if not future.done():
+                    self._fail(future, error)
+        self._requests.clear()
+        self._events.clear()
+
+    @staticmethod
+    def _fail(future: "asyncio.Future[Any]", error: Exception) -> None:
+        future.set_exception(error)
+        # Mark it retrieved, so a waiter that already gave up is not logged
+        future.exception()
+
+
 class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
     def __init__(
         self,
@@ -57,6 +246,14 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         timeout=None,
         key_press_delay=1,
         name="HASS",
+        settings_ttl=10,
+        thumbnail_cache=None,
+        upload_index=None,
+        heartbeat_interval=20,
+        reconnect_max_delay=60,
+        session=None,
+        device_info_ttl=5,
+        coalesce_requests=COALESCE_REQUESTS,
     ):
         _LOGGING.debug("Initializing SamsungTVAsyncArt")
         super().__init__(
@@ -72,9 +269,31 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         self.art_uuid = str(uuid.uuid4())
         self._rest_api: Optional[SamsungTVAsyncRest] = None
         self.art_mode = None
-        self.session = None
-        self.pending_requests = {}
+        self.session = session
+        self._owns_session = session is None
+        self.pending_requests = PendingArtRequests()
         self.callbacks = {}
+        self.connection_callback = None
+        self._connect_lock = asyncio.Lock()
+        self.settings_ttl = settings_ttl
+        self._settings = None
+        self._settings_time = 0.0
+        self._settings_lock = asyncio.Lock()
+        self.device_info_ttl = device_info_ttl
+        self._device_info = None
+        self._device_info_time = 0.0
+        self._device_info_lock = asyncio.Lock()
+        self.coalesce_requests = set(coalesce_requests)
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.catalog = ArtCatalog()
+        self.thumbnail_cache = thumbnail_cache
+        self.upload_index = upload_index
+        self._thumbnail_list_supported = None
+        self.last_upload_stats = None
+        self._transfer_lock = asyncio.Lock()
+        self.heartbeat_interval = heartbeat_interval
+        self.reconnect_max_delay = reconnect_max_delay
+        self._supervisor = None
 
     async def initialize(self):
         """Initialize the connection and token if needed"""
@@ -85,7 +304,7 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             try:
                 await self.open()
                 _LOGGING.debug("Opened connection")
-                await self.close()
+                await self._disconnect()
                 _LOGGING.debug("Closed connection")
             except Exception as e:
                 _LOGGING.debug("Unable to connect to %s - may be off?", self.host)
@@ -112,20 +331,27 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         self._websocket_event(event, response)
 
         if event != MS_CHANNEL_READY_EVENT:
-            await self.close()
+            await self._disconnect()
             raise exceptions.ConnectionFailure(response)
 
         return self.connection
 
     async def close(self) -> None:
         """Ensure proper cleanup of all resources."""
+        await self._disconnect()
+        if self.session and self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._rest_api = None
+
+    async def _disconnect(self) -> None:
+        """Close the art channel websocket, keeping the REST session for reuse"""
         _LOGGING.debug("Closing connection")
         try:
             # Clean up pending requests
-            for request in self.pending_requests.values():
-                if not request.done():
-                    request.cancel()
-            self.pending_requests.clear()
+            self.pending_requests.fail_all(
+                exceptions.ConnectionFailure("Art channel closed")
+            )
 
             if self._recv_loop and not self._recv_loop.done():
                 self._recv_loop.cancel()
@@ -154,33 +380,38 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
 
             if await super().start_listening(self.process_event):
                 _LOGGING.debug("Started listening")
-                try:
-                    await self.get_artmode()
-                except AssertionError:
-                    pass
+                # catalog events may have been missed while disconnected
+                self.catalog.invalidate()
+                # Sent directly: going through _ensure_listening would wait on
+                # the _connect_lock our caller holds
+                await self._request({"request": "get_artmode_status"})
                 return True
             return False
         except Exception as e:
             _LOGGING.debug("Error in start_listening: %s", str(e))
-            await self.close()  # Ensure clean shutdown on error
+            await self._disconnect()  # Ensure clean shutdown on error
             raise
 
     def get_uuid(self):
         self.art_uuid = str(uuid.uuid4())
         return self.art_uuid
 
-    async def wait_for_response(self, request_uuid, timeout=2):
+    async def wait_for_response(self, request_uuid, timeout=2, future=None):
+        """
+        Wait for the response registered as future, or for request_uuid
+        (a request id or event name) if no future is given
+        """
         data = None
+        if future is None:
+            future = self.pending_requests.get(request_uuid)
+            if future is None:
+                future = self.pending_requests.add(request_uuid, timeout)
         try:
-            if request_uuid not in self.pending_requests.keys():
-                self.pending_requests[request_uuid] = asyncio.Future()
-            response = await asyncio.wait_for(
-                self.pending_requests[request_uuid], timeout
-            )
+            response = await asyncio.wait_for(future, timeout)
             data = json.loads(response["data"])
         except asyncio.exceptions.TimeoutError:
             _LOGGING.debug("Timeout waiting for response to request %s", request_uuid)
-            raise exceptions.ResponseError(
+            raise exceptions.ResponseTimeout(
                 f"Timeout waiting for response to request {request_uuid}"
             )
         except Exception as e:
@@ -189,7 +420,7 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             )
             raise
         finally:
-            self.pending_requests.pop(request_uuid, None)
+            self.pending_requests.discard(future)
 
         if data and data.get("event", "*") == "error":
             raise exceptions.ResponseError(
@@ -205,57 +436,210 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         timeout: int = 2,
         retry_count: int = 1,
     ) -> Optional[Dict[str, Any]]:
-        """Send art request with connection check and retry logic."""
-        if not request_data.get("id"):
-            request_data["id"] = self.get_uuid()
-        request_data["request_id"] = request_data["id"]
+        """
+        Send art request with connection check and retry logic.
+        Concurrent requests of a type in coalesce_requests with the same payload
+        share one round trip, and the same response dict
+        """
+        if (
+            request_data.get("request") in self.coalesce_requests
+            and not wait_for_event
+        ):
+            key = json.dumps(
+                {
+                    name: value
+                    for name, value in request_data.items()
+                    if name not in ("id", "request_id")
+                },
+                sort_keys=True,
+            )
+            shared = self._inflight.get(key)
+            if shared is None:
+                shared = asyncio.ensure_future(
+                    self._send_art_request_once(
+                        request_data, None, timeout, retry_count
+                    )
+                )
+                self._inflight[key] = shared
+                shared.add_done_callback(lambda _: self._inflight.pop(key, None))
+            else:
+                _LOGGING.debug("Sharing in-flight %s request", request_data["request"])
+            return await asyncio.shield(shared)
+        return await self._send_art_request_once(
+            request_data, wait_for_event, timeout, retry_count
+        )
 
+    async def _send_art_request_once(
+        self,
+        request_data: Dict[str, Any],
+        wait_for_event: Optional[str] = None,
+        timeout: int = 2,
+        retry_count: int = 1,
+    ) -> Optional[Dict[str, Any]]:
         for attempt in range(retry_count + 1):
             try:
-                # Check if connection is stale
-                if self._recv_loop and self._recv_loop.done():
-                    _LOGGING.debug("Listener loop completed, resetting connection")
-                    await self.close()
-                    self._recv_loop = None
-
-                # Ensure we have an active listening connection
-                if not self._recv_loop or not self.is_alive():
-                    await self.start_listening()
-
-                self.pending_requests[
-                    wait_for_event or request_data["id"]
-                ] = asyncio.Future()
-                await self.send_command(
-                    ArtChannelEmitCommand.art_app_request(request_data)
-                )
-                return await self.wait_for_response(
-                    wait_for_event or request_data["id"], timeout
-                )
+                await self._ensure_listening()
+                return await self._request(request_data, wait_for_event, timeout)
 
             except exceptions.ResponseError as e:
                 if attempt == retry_count:
                     raise
                 _LOGGING.debug("Request failed, attempt %d: %s", attempt + 1, str(e))
-                await self.close()  # Force reconnection on next attempt
+                if not self.pending_requests:
+                    await self._disconnect()  # Force reconnection on next attempt
                 await asyncio.sleep(0.5)
 
             except Exception as e:
                 _LOGGING.debug("Unexpected error in _send_art_request: %s", str(e))
-                await self.close()
+                await self._disconnect()
+                raise
+
+    async def _request(
+        self,
+        request_data: Dict[str, Any],
+        wait_for_event: Optional[str] = None,
+        timeout: int = 2,
+    ) -> Optional[Dict[str, Any]]:
+        """send request_data on the open art channel and wait for the response"""
+        if not request_data.get("id"):
+            request_data["id"] = self.get_uuid()
+        request_data["request_id"] = request_data["id"]
+
+        if wait_for_event:
+            future = self.pending_requests.add_event(
+                wait_for_event, request_data["id"], timeout
+            )
+        else:
+            future = self.pending_requests.add(request_data["id"], timeout)
+        try:
+            await self.send_command(ArtChannelEmitCommand.art_app_request(request_data))
+        except BaseException:
+            self.pending_requests.discard(future)
+            raise
+        return await self.wait_for_response(
+            wait_for_event or request_data["id"], timeout, future=future
+        )
+
+    async def _ensure_listening(self):
+        """(re)open the art channel and start the listener if it is not running"""
+        if self._recv_loop and not self._recv_loop.done() and self.is_alive():
+            return
+        # Concurrent requests must not each reopen the connection
+        async with self._connect_lock:
+            # Check if connection is stale
+            if self._recv_loop and self._recv_loop.done():
+                _LOGGING.debug("Listener loop completed, resetting connection")
+                await self._disconnect()
+                self._recv_loop = None
+
+            # Ensure we have an active listening connection
+            if not self._recv_loop or not self.is_alive():
+                await self.start_listening()
+
+    def start_supervisor(self):
+        """
+        Keep the art channel connected in the background, so requests find a
+        warm connection instead of reconnecting after a drop
+        """
+        if self._supervisor is None or self._supervisor.done():
+            self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop_supervisor(self):
+        if self._supervisor:
+            self._supervisor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._supervisor
+            self._supervisor = None
+
+    async def _supervise(self):
+        """
+        ping the TV every heartbeat_interval seconds and reconnect as soon as the
+        listener stops or a ping goes unanswered. While the TV is unreachable,
+        reconnects back off exponentially (with jitter) up to reconnect_max_delay
+        """
+        failures = 0
+        connected = self.is_alive()
+        while True:
+            try:
+                await self._ensure_listening()
+                if not connected:
+                    connected = True
+                    self._notify_connection(True)
+                while await self._heartbeat():
+                    failures = 0
+                _LOGGING.debug("Art channel to %s dropped, reconnecting", self.host)
+                await self._disconnect()
+                connected = False
+                self._notify_connection(False)
+                if failures:
+                    raise exceptions.ConnectionFailure("connection dropped")
+                failures += 1
+            except asyncio.CancelledError:
                 raise
+            except Exception as e:
+                if connected:
+                    connected = False
+                    self._notify_connection(False)
+                failures += 1
+                delay = min(self.reconnect_max_delay, 2 ** (failures - 1))
+                delay *= random.uniform(0.5, 1)
+                _LOGGING.debug(
+                    "Unable to reconnect to %s, attempt %d, retrying in %.1fs: %s",
+                    self.host,
+                    failures,
+                    delay,
+                    str(e),
+                )
+                await asyncio.sleep(delay)
+
+    def _notify_connection(self, connected):
+        if self.connection_callback:
+            awaitable = self.connection_callback(connected)
+            if awaitable:
+                asyncio.create_task(awaitable)
+
+    async def _heartbeat(self):
+        """wait one heartbeat_interval and ping, returns False if the link is dead"""
+        recv_loop = self._recv_loop
+        if recv_loop is None:
+            return False
+        done, _ = await asyncio.wait({recv_loop}, timeout=self.heartbeat_interval)
+        if done or not self.is_alive():
+            return False
+        try:
+            pong = await self.connection.ping()
+            await asyncio.wait_for(pong, self.timeout or 10)
+        except (asyncio.TimeoutError, ConnectionClosed):
+            return False
+        return True
 
     async def process_event(self, event=None, response=None):
         if event == D2D_SERVICE_MESSAGE_EVENT:
             data = json.loads(response["data"])
             sub_event = data.get("event", "*")
-            if "artmode_status" in sub_event:
+            if sub_event == "artmode_status":
                 self.art_mode = data["value"] == "on"
             elif sub_event == "art_mode_changed":
                 self.art_mode = data["status"] == "on"
             elif sub_event == "go_to_standby":
                 self.art_mode = False
-            elif "wakeup" in sub_event:
+                self.invalidate_device_info()
+            elif sub_event == "wakeup":
+                self.invalidate_device_info()
                 asyncio.create_task(self.get_artmode())
+            if any(setting in sub_event for setting in ARTMODE_SETTINGS):
+                self.invalidate_artmode_settings()
+            self.catalog.apply_event(sub_event, data)
+            if sub_event == "image_deleted":
+                content_ids = ArtCatalog.event_content_ids(data)
+                loop = asyncio.get_running_loop()
+                if self.thumbnail_cache:
+                    for content_id in content_ids:
+                        loop.run_in_executor(
+                            None, self.thumbnail_cache.invalidate, content_id
+                        )
+                if self.upload_index:
+                    loop.run_in_executor(None, self.upload_index.discard, content_ids)
 
             if sub_event in self.callbacks.keys():
                 awaitable = self.callbacks[sub_event](event, response)
@@ -263,13 +647,7 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
                     asyncio.create_task(awaitable)
 
             request_id = data.get("request_id", data.get("id"))
-            try:
-                if request_id in self.pending_requests.keys():
-                    self.pending_requests[request_id].set_result(response)
-                elif sub_event in self.pending_requests.keys():
-                    self.pending_requests[sub_event].set_result(response)
-            except asyncio.exceptions.InvalidStateError:  # already completed
-                pass
+            self.pending_requests.resolve(request_id, sub_event, response)
 
     def set_callback(self, trigger, callback=None):
         if not callback:
@@ -277,9 +655,26 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         else:
             self.callbacks[trigger] = callback
 
+    def set_connection_callback(self, callback=None):
+        """
+        callback(connected) is called when the supervisor sees the art channel
+        drop or come back
+        """
+        self.connection_callback = callback
+
     def get_session(self):
+        """
+        The session passed in (eg Home Assistant's shared one), or an owned
+        session whose pooled connections are kept alive between polls and
+        closed by close()
+        """
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit_per_host=REST_CONNECTION_LIMIT,
+                keepalive_timeout=REST_KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
             self._rest_api = None
         return self.session
 
@@ -291,13 +686,38 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             )
         return self._rest_api
 
+    def _fresh_device_info(self):
+        if (
+            self._device_info is not None
+            and time.monotonic() - self._device_info_time < self.device_info_ttl
+        ):
+            return self._device_info
+        return None
+
     async def _get_device_info(self):
-        try:
-            await asyncio.sleep(0.1)  # do not hit rest api to frequently
-            return await self._get_rest_api().rest_device_info()
-        except Exception as e:
-            pass
-        return {}
+        """
+        REST device info, cached for device_info_ttl seconds (failures too, so an
+        unreachable TV is not retried by every caller); concurrent callers share
+        one fetch
+        """
+        data = self._fresh_device_info()
+        if data is not None:
+            return data
+        async with self._device_info_lock:
+            data = self._fresh_device_info()
+            if data is not None:
+                return data
+            try:
+                data = await self._get_rest_api().rest_device_info()
+            except Exception as e:
+                _LOGGING.debug("Unable to get device info: %s", str(e))
+                data = {}
+            self._device_info = data
+            self._device_info_time = time.monotonic()
+            return data
+
+    def invalidate_device_info(self):
+        self._device_info = None
 
     async def supported(self) -> bool:
         data = await self._get_device_info()
@@ -325,23 +745,28 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         assert data
         return data
 
-    async def available(self, category=None):
+    async def available(self, category=None, refresh=False):
         """
         category is 'MY-C0004' or 'MY-C0002' where 4 is favourites, 2 is my pictures, and 8 is store
+        answered from the local catalog, which is loaded on first use (or refresh)
+        and kept current from art channel events
         """
-        data = await self._send_art_request(
-            {"request": "get_content_list", "category": category}
-        )
-        assert data
-        return (
-            [
-                v
-                for v in json.loads(data["content_list"])
-                if v["category_id"] == category
-            ]
-            if category
-            else json.loads(data["content_list"])
-        )
+        if refresh or not self.catalog.loaded:
+            data = await self._send_art_request({"request": "get_content_list"})
+            assert data
+            self.catalog.load(json.loads(data["content_list"]))
+            if self.upload_index:
+                content_ids = [item["content_id"] for item in self.catalog.items()]
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.upload_index.reconcile, content_ids
+                )
+        return self.catalog.items(category)
+
+    async def get_content(self, content_id):
+        """Return the catalog entry for content_id, or None"""
+        if not self.catalog.loaded:
+            await self.available()
+        return self.catalog.get(content_id)
 
     async def get_current(self):
         data = await self._send_art_request({"request": "get_current_artwork"})
@@ -360,11 +785,30 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         """
         setting can be any of 'brightness', 'color_temperature', 'motion_sensitivity',
         'motion_timer', or 'brightness_sensor_setting'
+        settings are cached for settings_ttl seconds, so reading several of them
+        costs one request
         """
-        data = await self._send_art_request({"request": "get_artmode_settings"})
-        assert data
-        data = json.loads(data["data"])
-        return next(iter(item for item in data if item["item"] == setting), data)
+        data = await self._get_artmode_settings_list()
+        return next(
+            iter(dict(item) for item in data if item["item"] == setting),
+            [dict(item) for item in data],
+        )
+
+    async def _get_artmode_settings_list(self):
+        async with self._settings_lock:
+            if (
+                self._settings is not None
+                and time.monotonic() - self._settings_time < self.settings_ttl
+            ):
+                return self._settings
+            data = await self._send_art_request({"request": "get_artmode_settings"})
+            assert data
+            self._settings = json.loads(data["data"])
+            self._settings_time = time.monotonic()
+            return self._settings
+
+    def invalidate_artmode_settings(self):
+        self._settings = None
 
     async def get_auto_rotation_status(self):
         data = await self._send_art_request({"request": "get_auto_rotation_status"})
@@ -419,13 +863,17 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         data = await self._send_art_request(
             {"request": "set_brightness", "value": value}
         )
+        self.invalidate_artmode_settings()
         assert data
         return data
 
     async def get_color_temperature(self):
-        data = await self._send_art_request({"request": "get_color_temperature"})
-        if not data:
+        try:
             data = await self.get_artmode_settings("color_temperature")
+        except exceptions.ResponseError:
+            data = None
+        if not isinstance(data, dict):
+            data = await self._send_art_request({"request": "get_color_temperature"})
         assert data
         return data
 
@@ -433,12 +881,97 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         data = await self._send_art_request(
             {"request": "set_color_temperature", "value": value}
         )
+        self.invalidate_artmode_settings()
         assert data
         return data
 
+    async def get_state_bundle(self):
+        """
+        Request art mode, brightness, color temperature, slideshow status and
+        current artwork concurrently; responses are matched by request id.
+        Items that fail are returned as None
+        """
+        requests = {
+            "artmode": self.get_artmode(),
+            "brightness": self.get_brightness(),
+            "color_temperature": self.get_color_temperature(),
+            "slideshow_status": self.get_slideshow_status(),
+            "current": self.get_current(),
+        }
+        results = await asyncio.gather(*requests.values(), return_exceptions=True)
+        bundle = {}
+        for key, result in zip(requests.keys(), results):
+            if isinstance(result, Exception):
+                _LOGGING.debug("Failed to get %s: %r", key, result)
+                result = None
+            bundle[key] = result
+        return bundle
+
+    async def _get_cached_thumbnails(self, content_id_list):
+        """
+        Split content_id_list into cached thumbnails ({filename: data}) and
+        the content ids that still have to be fetched from the TV
+        """
+        cached = {}
+        missing = []
+        if not self.thumbnail_cache:
+            return cached, list(content_id_list)
+        loop = asyncio.get_running_loop()
+        for content_id in content_id_list:
+            entry = await loop.run_in_executor(
+                None, self.thumbnail_cache.get, content_id
+            )
+            if entry:
+                cached[entry[0]] = entry[1]
+            else:
+                missing.append(content_id)
+        return cached, missing
+
+    async def _cache_thumbnail(self, filename, data):
+        if self.thumbnail_cache:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.thumbnail_cache.put, filename, bytes(data)
+            )
+
     async def get_thumbnail_list(self, content_id_list=[]):
         if isinstance(content_id_list, str):
             content_id_list = [content_id_list]
+        thumbnail_data_dict, content_id_list = await self._get_cached_thumbnails(
+            content_id_list
+        )
+        if content_id_list:
+            thumbnail_data_dict.update(
+                await self._fetch_thumbnail_list(content_id_list)
+            )
+        return thumbnail_data_dict
+
+    async def _fetch_thumbnail_list(self, content_id_list):
+        return {
+            filename: data
+            async for filename, data in self._stream_thumbnail_list(content_id_list)
+        }
+
+    async def iter_thumbnail_list(self, content_id_list=[], sink=None):
+        """
+        async for filename, data in iter_thumbnail_list(...) yields each thumbnail
+        as soon as it has been read, so only one is held in memory at a time
+        sink can be a directory, thumbnails are then written there in chunks and
+        (filename, path) is yielded, or a (sync or async) callable
+        sink(filename, chunk), in which case (filename, None) is yielded
+        """
+        if isinstance(content_id_list, str):
+            content_id_list = [content_id_list]
+        if sink is None:
+            cached, content_id_list = await self._get_cached_thumbnails(
+                content_id_list
+            )
+            for filename, data in cached.items():
+                yield filename, data
+        if content_id_list:
+            async for item in self._stream_thumbnail_list(content_id_list, sink):
+                yield item
+
+    async def _stream_thumbnail_list(self, content_id_list, sink=None):
         content_id_list = [{"content_id": id} for id in content_id_list]
         data = await self._send_art_request(
             {
@@ -457,19 +990,62 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         reader, writer = await asyncio.open_connection(
             conn_info["ip"], int(conn_info["port"]), ssl=ssl_context
         )
-        total_num_thumbnails = 1
-        current_thumb = -1
-        thumbnail_data_dict = {}
-        while current_thumb + 1 < total_num_thumbnails:
-            header_len = int.from_bytes(await reader.readexactly(4), "big")
-            header = json.loads(await reader.readexactly(header_len))
-            thumbnail_data_len = int(header["fileLength"])
-            current_thumb = int(header["num"])
-            total_num_thumbnails = int(header["total"])
-            filename = "{}.{}".format(header["fileID"], header["fileType"])
-            thumbnail_data_dict[filename] = await reader.readexactly(thumbnail_data_len)
-        writer.close()
-        return thumbnail_data_dict
+        try:
+            total_num_thumbnails = 1
+            current_thumb = -1
+            while current_thumb + 1 < total_num_thumbnails:
+                header_len = int.from_bytes(await reader.readexactly(4), "big")
+                header = json.loads(await reader.readexactly(header_len))
+                thumbnail_data_len = int(header["fileLength"])
+                current_thumb = int(header["num"])
+                total_num_thumbnails = int(header["total"])
+                filename = "{}.{}".format(header["fileID"], header["fileType"])
+                if sink is None:
+                    thumbnail_data = await reader.readexactly(thumbnail_data_len)
+                    await self._cache_thumbnail(filename, thumbnail_data)
+                    yield filename, thumbnail_data
+                else:
+                    yield filename, await self._copy_to_sink(
+                        reader, thumbnail_data_len, filename, sink
+                    )
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _copy_to_sink(reader, length, filename, sink):
+        """Copy length bytes from reader to sink in D2D_CHUNK_SIZE pieces"""
+        loop = asyncio.get_running_loop()
+        path = None
+        if isinstance(sink, (str, os.PathLike)):
+            # filename comes from the TV, never let it leave the sink directory
+            name = os.path.basename(filename)
+            if name in ("", ".", ".."):
+                raise exceptions.ResponseError(
+                    "Invalid thumbnail filename {!r}".format(filename)
+                )
+            path = os.path.join(sink, name)
+            f = await loop.run_in_executor(None, open, path, "wb")
+
+            def write(chunk):
+                return loop.run_in_executor(None, f.write, chunk)
+
+        else:
+
+            def write(chunk):
+                return sink(filename, chunk)
+
+        try:
+            remaining = length
+            while remaining:
+                chunk = await reader.readexactly(min(remaining, D2D_CHUNK_SIZE))
+                remaining -= len(chunk)
+                result = write(chunk)
+                if inspect.isawaitable(result):
+                    await result
+        finally:
+            if path:
+                await loop.run_in_executor(None, f.close)
+        return path
 
     async def get_thumbnail(self, content_id_list=[], as_dict=False):
         if isinstance(content_id_list, str):
@@ -477,6 +1053,11 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         thumbnail_data_dict = {}
         thumbnail_data = None
         for content_id in content_id_list:
+            cached, missing = await self._get_cached_thumbnails([content_id])
+            if cached:
+                filename, thumbnail_data = next(iter(cached.items()))
+                thumbnail_data_dict[filename] = thumbnail_data
+                continue
             data = await self._send_art_request(
                 {
                     "request": "get_thumbnail",
@@ -490,8 +1071,11 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             )
             assert data
             conn_info = json.loads(data["conn_info"])
+            ssl_context = (
+                get_ssl_context() if conn_info.get("secured", False) else None
+            )
             reader, writer = await asyncio.open_connection(
-                conn_info["ip"], int(conn_info["port"])
+                conn_info["ip"], int(conn_info["port"]), ssl=ssl_context
             )
             header_len = int.from_bytes(await reader.readexactly(4), "big")
             header = json.loads(await reader.readexactly(header_len))
@@ -500,6 +1084,7 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             writer.close()
             filename = "{}.{}".format(header["fileID"], header["fileType"])
             thumbnail_data_dict[filename] = thumbnail_data
+            await self._cache_thumbnail(filename, thumbnail_data)
         return (
             thumbnail_data_dict
             if as_dict
@@ -508,6 +1093,50 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             else thumbnail_data
         )
 
+    async def get_thumbnails(
+        self, content_id_list, chunk_size=THUMBNAIL_CHUNK_SIZE, concurrency=1
+    ):
+        """
+        Fetch thumbnails for many content ids as {filename: data}
+        ids are requested chunk_size at a time with get_thumbnail_list, running up
+        to concurrency transfers in parallel. TVs without get_thumbnail_list fall
+        back to one get_thumbnail request per id
+        """
+        if isinstance(content_id_list, str):
+            content_id_list = [content_id_list]
+        thumbnail_data_dict, missing = await self._get_cached_thumbnails(
+            content_id_list
+        )
+        chunks = [
+            missing[i : i + chunk_size] for i in range(0, len(missing), chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(chunk):
+            async with semaphore:
+                if self._thumbnail_list_supported is not False:
+                    try:
+                        result = await self._fetch_thumbnail_list(chunk)
+                        self._thumbnail_list_supported = True
+                        return result
+                    except exceptions.ResponseError as e:
+                        # Only an error event from the TV means it lacks
+                        # get_thumbnail_list, a slow reply does not
+                        if self._thumbnail_list_supported or isinstance(
+                            e, exceptions.ResponseTimeout
+                        ):
+                            raise
+                        _LOGGING.debug(
+                            "get_thumbnail_list failed, using get_thumbnail: %s",
+                            str(e),
+                        )
+                        self._thumbnail_list_supported = False
+                return await self.get_thumbnail(chunk, as_dict=True)
+
+        for result in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            thumbnail_data_dict.update(result)
+        return thumbnail_data_dict
+
     async def upload(
         self,
         file,
@@ -516,27 +1145,107 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
         file_type="png",
         date=None,
         timeout=10,
+        file_size=None,
+        progress=None,
+        zero_copy=None,
+        preprocessor=None,
     ):
         """
+        file can be a path, bytes, a file-like object or an async iterator of bytes
+        (which needs file_size). The image is streamed in UPLOAD_CHUNK_SIZE chunks
+        with file reads off the event loop; progress(sent, total) is called after
+        each chunk
+        zero_copy (default: auto) hands path uploads to the kernel with sendfile
+        when the transfer socket is not secured. Throughput of the last upload is
+        kept in last_upload_stats
+        preprocessor (an image_prep.ImagePreprocessor) resizes and re-encodes the
+        image to panel resolution in a worker process before it is sent
+        with an upload_index, images already on the TV are not sent again and
+        their existing content_id is returned
         NOTE: both id's and request_id have to be the same
         """
-        if isinstance(file, str):
-            file_name, file_extension = os.path.splitext(file)
-            file_type = file_extension[1:]
-            with open(file, "rb") as f:
-                file = f.read()
+        source = UploadSource(file, file_type, file_size)
+        content_id, source, digests = await self._find_uploaded(source, preprocessor)
+        if content_id:
+            return content_id
+        ticket = await self._prepare_upload(source, matte, portrait_matte, date)
+        content_id, _ = await self._transfer_upload(
+            source, ticket, timeout, zero_copy, progress
+        )
+        await self._remember_upload(digests, content_id)
+        return content_id
 
-        file_size = len(file)
-        file_type = file_type.lower()
-        if file_type == "jpeg":
-            file_type = "jpg"
+    async def upload_many(
+        self, files, window=2, retries=2, progress=None, **upload_kwargs
+    ):
+        """
+        Upload a collection of images, pipelining send_image handshakes with the
+        transfers and retrying failures, see BulkUploader
+        returns one result dict per file
+        """
+        return await BulkUploader(
+            self, window=window, retries=retries, progress=progress, **upload_kwargs
+        ).run(files)
 
+    async def sync_folder(self, directory, **kwargs):
+        """
+        Mirror directory into My Pictures, sending only what changed since the
+        last sync, see FolderSync
+        returns a summary dict
+        """
+        return await FolderSync(self, directory, **kwargs).run()
+
+    async def _find_uploaded(self, source, preprocessor=None):
+        """
+        look source up in the upload index by its raw and (if preprocessor is
+        given) preprocessed content hash, preprocessing it on the way
+        returns (existing content_id or None, source to send, hashes)
+        """
+        digests = []
+        for prepare in (False, True):
+            if prepare:
+                if not preprocessor:
+                    break
+                source = await preprocessor.process(source)
+            if not self.upload_index:
+                continue
+            digest = await content_hash(source)
+            if digest is None:
+                continue
+            digests.append(digest)
+            content_id = await asyncio.get_running_loop().run_in_executor(
+                None, self.upload_index.get, digest
+            )
+            # Loading the catalog reconciles the index with the TV's content list
+            if content_id and await self.get_content(content_id):
+                _LOGGING.debug(
+                    "%s is already on the TV as %s", source.name, content_id
+                )
+                await self._remember_upload(digests, content_id)
+                return content_id, source, digests
+        return None, source, digests
+
+    async def _remember_upload(self, digests, content_id):
+        if self.upload_index and digests and content_id:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.upload_index.add, digests, content_id
+            )
+
+    async def _prepare_upload(
+        self,
+        source,
+        matte="shadowbox_polar",
+        portrait_matte="shadowbox_polar",
+        date=None,
+    ):
+        """send_image handshake, returns the transfer socket's conn_info"""
+        file_size = await source.get_size()
         if date is None:
             date = datetime.now().strftime("%Y:%m:%d %H:%M:%S")
         data = await self._send_art_request(
             {
                 "request": "send_image",
-                "file_type": file_type,
+                "file_type": source.file_type,
                 "request_id": self.get_uuid(),
                 "id": self.art_uuid,
                 "conn_info": {
@@ -551,30 +1260,110 @@ class SamsungTVAsyncArt(SamsungTVWSAsyncConnection):
             }
         )
         assert data
-        conn_info = json.loads(data["conn_info"])
+        return json.loads(data["conn_info"])
+
+    async def _transfer_upload(
+        self, source, conn_info, timeout=10, zero_copy=None, progress=None
+    ):
+        """
+        Send the image for a prepared upload and wait for image_added
+        returns (content_id, transfer stats)
+        Transfers run one at a time, as image_added does not say which upload
+        it belongs to
+        """
         header = json.dumps(
             {
                 "num": 0,
                 "total": 1,
-                "fileLength": file_size,
+                "fileLength": source.file_size,
                 "fileName": "dummy",
-                "fileType": file_type,
+                "fileType": source.file_type,
                 "secKey": conn_info["key"],
                 "version": "0.0.1",
             }
         )
-
-        ssl_context = get_ssl_context() if conn_info.get("secured", False) else None
+        async with self._transfer_lock:
+            # Queue for image_added before the transfer so the event can't be missed
+            image_added = self.pending_requests.add_event(
+                "image_added", timeout=timeout
+            )
+            try:
+                stats = await self._send_upload(
+                    conn_info, header, source, zero_copy, progress
+                )
+            except BaseException:
+                self.pending_requests.discard(image_added)
+                raise
+            data = await self.wait_for_response(
+                "image_added", timeout=timeout, future=image_added
+            )
+        return (data["content_id"] if data else None), stats
+
+    async def _send_upload(self, conn_info, header, source, zero_copy, progress):
+        """Send header and image over the D2D transfer socket"""
+        secured = conn_info.get("secured", False)
+        if zero_copy is None:
+            zero_copy = source.path is not None and not secured
+        elif zero_copy and (source.path is None or secured):
+            _LOGGING.debug("zero copy upload needs a path and plain TCP, streaming")
+            zero_copy = False
+
+        file_size = source.file_size
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
         reader, writer = await asyncio.open_connection(
-            conn_info["ip"], int(conn_info["port"]), ssl=ssl_context
+            conn_info["ip"],
+            int(conn_info["port"]),
+            ssl=get_ssl_context() if secured else None,
+        )
+        try:
+            writer.write(len(header).to_bytes(4, "big"))
+            writer.write(header.encode("ascii"))
+            await writer.drain()
+            if zero_copy:
+                f = await loop.run_in_executor(None, open, source.path, "rb")
+                try:
+                    sent = await loop.sendfile(writer.transport, f, count=file_size)
+                finally:
+                    await loop.run_in_executor(None, f.close)
+                if progress:
+                    progress(sent, file_size)
+            else:
+                sent = 0
+                async for chunk in source.chunks(UPLOAD_CHUNK_SIZE):
+                    if sent + len(chunk) > file_size:
+                        # Never put more on the socket than send_image announced
+                        raise ValueError(
+                            f"{source.name} is larger than {file_size} bytes"
+                        )
+                    writer.write(chunk)
+                    await writer.drain()
+                    sent += len(chunk)
+                    if progress:
+                        progress(sent, file_size)
+            if sent != file_size:
+                raise ValueError(f"Sent {sent} of {file_size} bytes of {source.name}")
+        finally:
+            writer.close()
+
+        elapsed = time.monotonic() - start
+        self.last_upload_stats = {
+            "mode": "sendfile" if zero_copy else "stream",
+            "bytes": sent,
+            "seconds": elapsed,
+            "bytes_per_second": sent / elapsed if elapsed > 0 else None,
+            "buffer_bytes": 0 if zero_copy else min(UPLOAD_CHUNK_SIZE, sent),
+        }
+        _LOGGING.debug(
+            "Uploaded %d bytes of %s in %.2fs (%.1f MB/s, %s, %d byte buffer)",
+            sent,
+            source.name,
+            elapsed,
+            sent / elapsed / 1e6 if elapsed > 0 else 0,
+            self.last_upload_stats["mode"],
+            self.last_upload_stats["buffer_bytes"],
         )
-        writer.write(len(header).to_bytes(4, "big"))
-        writer.write(header.encode("ascii"))
-        writer.write(file)
-        await writer.drain()
-        writer.close()
-        data = await self.wait_for_response("image_added", timeout=timeout)
-        return data["content_id"] if data else None
+        return self.last_upload_stats
 
     async def delete(self, content_id):
         await self.delete_list([content_id])
@@ -10,10 +10,23 @@ import asyncio
 import contextlib
 import json
 import logging
+import os
+import tempfile
 from types import TracebackType
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import aiofiles
+import aiofiles.os
 from websockets.client import WebSocketClientProtocol, connect
 from websockets.exceptions import ConnectionClosed
 from websockets.protocol import State
@@ -29,6 +42,24 @@ from .helper import get_ssl_context
 
 _LOGGING = logging.getLogger(__name__)
 
+# token_file path -> (mtime_ns, token), shared by every connection in the process
+_TOKEN_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def _write_token_file(path: str, token: str) -> int:
+    """Atomically replace the token file, returns its new mtime_ns."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(token)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return os.stat(path).st_mtime_ns
+
 
 class SamsungTVWSAsyncConnection(connection.SamsungTVWSBaseConnection):
     connection: Optional[WebSocketClientProtocol]
@@ -98,13 +129,19 @@ class SamsungTVWSAsyncConnection(connection.SamsungTVWSBaseConnection):
             return self._URL_FORMAT.format(**params)
 
     async def _get_token(self) -> Optional[str]:
+        """Token from memory, re-reading token_file only if its mtime changed."""
         _LOGGING.debug("Getting token from file: %s", self.token_file)
         if self.token_file is not None:
             try:
+                mtime = (await aiofiles.os.stat(self.token_file)).st_mtime_ns
+                cached = _TOKEN_CACHE.get(self.token_file)
+                if cached and cached[0] == mtime:
+                    return cached[1]
                 async with aiofiles.open(self.token_file) as token_file:
                     token = (await token_file.read()).strip()
                     _LOGGING.debug("Token file content: %s", token)
-                    return token
+                _TOKEN_CACHE[self.token_file] = (mtime, token)
+                return token
             except OSError:
                 _LOGGING.error("Failed to open token file: %s", self.token_file)
                 return None
@@ -114,12 +151,21 @@ class SamsungTVWSAsyncConnection(connection.SamsungTVWSBaseConnection):
 
     async def set_token(self, token: str) -> None:
         """Set token in memory or file asynchronously."""
-        _LOGGING.info("New token %s", token)
         if self.token_file is not None:
+            cached = _TOKEN_CACHE.get(self.token_file)
+            if cached and cached[1] == token:
+                with contextlib.suppress(OSError):
+                    stat = await aiofiles.os.stat(self.token_file)
+                    if stat.st_mtime_ns == cached[0]:
+                        return
+            _LOGGING.info("New token %s", token)
             _LOGGING.debug("Save token to file: %s", token)
-            async with aiofiles.open(self.token_file, "w") as token_file:
-                await token_file.write(token)
+            mtime = await asyncio.get_running_loop().run_in_executor(
+                None, _write_token_file, self.token_file, token
+            )
+            _TOKEN_CACHE[self.token_file] = (mtime, token)
         else:
+            _LOGGING.info("New token %s", token)
             self.token = token
 
     async def check_for_token(self, response: Dict[str, Any]) -> None:
@@ -0,0 +1,279 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+_LOGGING = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+# upload() keywords that apply to every file of a bulk upload
+BULK_UPLOAD_KWARGS = frozenset(
+    (
+        "date",
+        "file_type",
+        "matte",
+        "portrait_matte",
+        "preprocessor",
+        "timeout",
+        "zero_copy",
+    )
+)
+
+
+async def _call(func: Any, *args: Any) -> Any:
+    """Await func if it is a coroutine function, else run it in an executor."""
+    if inspect.iscoroutinefunction(func):
+        return await func(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+class UploadSource:
+    """
+    A file to upload to the TV.
+
+    file can be a path, bytes, a binary file-like object (sync or async, eg
+    aiofiles) or an async iterator of bytes. Paths and sync file objects are
+    read in executor threads, chunk_size bytes at a time, so the event loop is
+    never blocked and only one chunk is held in memory. file_size is required
+    for async iterators and unseekable file objects.
+    """
+
+    def __init__(
+        self, file: Any, file_type: str = "png", file_size: Optional[int] = None
+    ) -> None:
+        self.file = file
+        self.path: Optional[str] = None
+        if isinstance(file, (str, os.PathLike)):
+            self.path = os.fspath(file)
+            file_type = os.path.splitext(self.path)[1][1:]
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            file_size = len(file)
+        file_type = file_type.lower()
+        if file_type == "jpeg":
+            file_type = "jpg"
+        self.file_type = file_type
+        self.file_size = file_size
+
+    @property
+    def name(self) -> str:
+        if self.path:
+            return self.path
+        if isinstance(self.file, (bytes, bytearray, memoryview)):
+            return "<{} bytes>".format(len(self.file))
+        return getattr(self.file, "name", None) or repr(self.file)
+
+    async def get_size(self) -> int:
+        if self.file_size is None:
+            if self.path:
+                self.file_size = await _call(os.path.getsize, self.path)
+            elif hasattr(self.file, "seek") and hasattr(self.file, "tell"):
+                position = await _call(self.file.tell)
+                end = await _call(self.file.seek, 0, os.SEEK_END)
+                await _call(self.file.seek, position)
+                self.file_size = end - position
+            else:
+                raise ValueError(
+                    "file_size is required to upload {}".format(self.name)
+                )
+        return self.file_size
+
+    async def chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        if self.path:
+            f = await _call(open, self.path, "rb")
+            try:
+                while chunk := await _call(f.read, chunk_size):
+                    yield chunk
+            finally:
+                await _call(f.close)
+        elif isinstance(self.file, (bytes, bytearray, memoryview)):
+            view = memoryview(self.file)
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset : offset + chunk_size]
+        elif hasattr(self.file, "read"):
+            while chunk := await _call(self.file.read, chunk_size):
+                yield chunk
+        else:
+            async for chunk in self.file:
+                yield chunk
+
+
+class BulkUploader:
+    """
+    Upload a collection of images with SamsungTVAsyncArt.
+
+    send_image handshakes run up to window images ahead of the D2D transfers,
+    which the TV receives one at a time so that each image_added event can be
+    matched to its upload. Failed images are retried up to retries times with
+    exponential backoff, without restarting the batch. Sources that can only
+    be read once (file objects, async iterators) are not retried.
+
+    With a preprocessor (an image_prep.ImagePreprocessor) images are prepared
+    in worker processes while earlier ones transfer; at most 2 * window
+    prepared images are held in memory at once. Images the art object's
+    upload index already knows are on the TV are not sent again (existing is
+    True in their result).
+
+    progress(index, name, sent, total) is called as each file is sent.
+    """
+
+    def __init__(
+        self,
+        art: Any,
+        window: int = 2,
+        retries: int = 2,
+        retry_delay: float = 1,
+        progress: Optional[Callable[[int, str, int, int], None]] = None,
+        **upload_kwargs: Any,
+    ) -> None:
+        self.art = art
+        self.window = max(1, window)
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.progress = progress
+        unknown = set(upload_kwargs) - BULK_UPLOAD_KWARGS
+        if unknown:
+            raise TypeError(
+                "Unsupported bulk upload arguments: {}".format(
+                    ", ".join(sorted(unknown))
+                )
+            )
+        self.upload_kwargs = upload_kwargs
+
+    async def run(self, sources: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Upload sources (anything upload() accepts, or UploadSource objects)
+        returns one result dict per source, in order, with the content_id (None on
+        failure), error, attempts, bytes, seconds, bytes_per_second and existing
+        """
+        file_type = self.upload_kwargs.get("file_type", "png")
+        sources = [
+            source
+            if isinstance(source, UploadSource)
+            else UploadSource(source, file_type)
+            for source in sources
+        ]
+        window = asyncio.Semaphore(self.window)
+        ahead = asyncio.Semaphore(2 * self.window)
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                self._upload_one(index, source, window, ahead)
+                for index, source in enumerate(sources)
+            )
+        )
+        elapsed = time.monotonic() - start
+        total_bytes = sum(result["bytes"] for result in results)
+        _LOGGING.debug(
+            "Uploaded %d of %d images, %d bytes in %.2fs (%.1f MB/s)",
+            sum(1 for result in results if result["content_id"]),
+            len(results),
+            total_bytes,
+            elapsed,
+            total_bytes / elapsed / 1e6 if elapsed > 0 else 0,
+        )
+        return results
+
+    async def _upload_one(
+        self,
+        index: int,
+        source: UploadSource,
+        window: asyncio.Semaphore,
+        ahead: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "source": source.name,
+            "content_id": None,
+            "error": None,
+            "attempts": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+            "bytes_per_second": None,
+            "existing": False,
+        }
+        kwargs = dict(self.upload_kwargs)
+        timeout = kwargs.pop("timeout", 10)
+        zero_copy = kwargs.pop("zero_copy", None)
+        preprocessor = kwargs.pop("preprocessor", None)
+        kwargs.pop("file_type", None)
+        name = source.name
+
+        def progress(sent: int, total: int) -> None:
+            if self.progress:
+                self.progress(index, name, sent, total)
+
+        async with ahead:
+            try:
+                content_id, source, digests = await self.art._find_uploaded(
+                    source, preprocessor
+                )
+            except Exception as e:
+                _LOGGING.debug("Unable to prepare %s: %s", name, str(e))
+                result["error"] = str(e) or type(e).__name__
+                return result
+            if content_id:
+                result.update(content_id=content_id, existing=True)
+                return result
+            await self._transfer_with_retries(
+                source, result, window, kwargs, timeout, zero_copy, progress
+            )
+        await self.art._remember_upload(digests, result["content_id"])
+        return result
+
+    async def _transfer_with_retries(
+        self,
+        source: UploadSource,
+        result: Dict[str, Any],
+        window: asyncio.Semaphore,
+        kwargs: Dict[str, Any],
+        timeout: float,
+        zero_copy: Optional[bool],
+        progress: Callable[[int, int], None],
+    ) -> None:
+        retryable = source.path is not None or isinstance(
+            source.file, (bytes, bytearray, memoryview)
+        )
+        for attempt in range(self.retries + 1 if retryable else 1):
+            result["attempts"] = attempt + 1
+            try:
+                async with window:
+                    conn_info = await self.art._prepare_upload(source, **kwargs)
+                    content_id, stats = await self.art._transfer_upload(
+                        source, conn_info, timeout, zero_copy, progress
+                    )
+            except Exception as e:
+                _LOGGING.debug(
+                    "Upload of %s failed, attempt %d: %s",
+                    result["source"],
+                    attempt + 1,
+                    str(e),
+                )
+                result["error"] = str(e) or type(e).__name__
+                if attempt < self.retries and retryable:
+                    await asyncio.sleep(self.retry_delay * 2**attempt)
+                continue
+            result.update(
+                content_id=content_id,
+                error=None,
+                bytes=stats["bytes"],
+                seconds=stats["seconds"],
+                bytes_per_second=stats["bytes_per_second"],
+            )
+            break
@@ -25,6 +25,12 @@ class ResponseError(Exception):
     pass
 
 
+class ResponseTimeout(ResponseError):
+    """No response to an art request in time."""
+
+    pass
+
+
 class HttpApiError(Exception):
     """Error using HTTP API."""
 
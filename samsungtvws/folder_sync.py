@@ -0,0 +1,196 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .art_catalog import MY_PICTURES_CATEGORY
+
+_LOGGING = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".frame_sync.json"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+class FolderSync:
+    """
+    Mirror a local directory into the TV's My Pictures category.
+
+    A manifest (by default .frame_sync.json in the directory) records the
+    size, mtime, mattes and content_id of every file synced. Each run makes
+    one get_content_list request, then uploads only new or modified files,
+    deletes images whose files were removed (in one delete_image_list
+    request) and re-applies mattes that differ from the ones wanted. Files
+    are not read unless they are uploaded.
+    """
+
+    def __init__(
+        self,
+        art: Any,
+        directory: str,
+        manifest_path: Optional[str] = None,
+        matte: str = "shadowbox_polar",
+        portrait_matte: str = "shadowbox_polar",
+        extensions: Sequence[str] = IMAGE_EXTENSIONS,
+        delete: bool = True,
+        **upload_kwargs: Any,
+    ) -> None:
+        self.art = art
+        self.directory = directory
+        self.manifest_path = manifest_path or os.path.join(directory, MANIFEST_NAME)
+        self.matte = matte or "none"
+        self.portrait_matte = portrait_matte or "none"
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.delete = delete
+        self.upload_kwargs = upload_kwargs
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Sync the directory, returns a summary dict of the uploaded, deleted and
+        rematted content_ids, the number of unchanged files and failed uploads
+        """
+        loop = asyncio.get_running_loop()
+        files, manifest = await loop.run_in_executor(None, self._scan)
+        on_tv = {
+            item["content_id"]: item
+            for item in await self.art.available(MY_PICTURES_CATEGORY, refresh=True)
+        }
+        summary: Dict[str, Any] = {
+            "uploaded": [],
+            "deleted": [],
+            "rematted": [],
+            "unchanged": 0,
+            "failed": [],
+        }
+        synced: Dict[str, Dict[str, Any]] = {}
+        to_upload: List[str] = []
+        for name, (size, mtime) in files.items():
+            entry = manifest.get(name)
+            if (
+                entry
+                and entry["content_id"] in on_tv
+                and entry["size"] == size
+                and entry["mtime"] == mtime
+            ):
+                synced[name] = entry
+            else:
+                to_upload.append(name)
+
+        if to_upload:
+            results = await self.art.upload_many(
+                [os.path.join(self.directory, name) for name in to_upload],
+                matte=self.matte,
+                portrait_matte=self.portrait_matte,
+                **self.upload_kwargs,
+            )
+            for name, result in zip(to_upload, results):
+                if not result["content_id"]:
+                    summary["failed"].append({"file": name, "error": result["error"]})
+                    continue
+                size, mtime = files[name]
+                synced[name] = {
+                    "content_id": result["content_id"],
+                    "size": size,
+                    "mtime": mtime,
+                    "matte": self.matte,
+                    "portrait_matte": self.portrait_matte,
+                }
+                if not result["existing"]:
+                    summary["uploaded"].append(result["content_id"])
+
+        uploaded = set(summary["uploaded"])
+        for entry in synced.values():
+            if entry["content_id"] in uploaded:
+                continue
+            # An image already on the TV (unchanged, or found by the upload
+            # index) may have been given other mattes
+            item = on_tv.get(entry["content_id"], {})
+            current = (
+                item.get("matte_id", entry.get("matte")),
+                item.get("portrait_matte_id", entry.get("portrait_matte")),
+            )
+            if current == (self.matte, self.portrait_matte):
+                summary["unchanged"] += 1
+                continue
+            await self.art.change_matte(
+                entry["content_id"], self.matte, self.portrait_matte
+            )
+            entry.update(matte=self.matte, portrait_matte=self.portrait_matte)
+            summary["rematted"].append(entry["content_id"])
+
+        if self.delete:
+            keep = {entry["content_id"] for entry in synced.values()}
+            failed = {item["file"] for item in summary["failed"]}
+            stale = {
+                entry["content_id"]
+                for name, entry in manifest.items()
+                if name not in failed and entry["content_id"] not in keep
+            }
+            stale = sorted(content_id for content_id in stale if content_id in on_tv)
+            if stale:
+                await self.art.delete_list(stale)
+                summary["deleted"] = stale
+
+        # Keep entries for failed files so a later run can still clean them up
+        for item in summary["failed"]:
+            if item["file"] in manifest:
+                synced[item["file"]] = manifest[item["file"]]
+        await loop.run_in_executor(None, self._save_manifest, synced)
+        _LOGGING.debug(
+            "Synced %s: %d uploaded, %d deleted, %d rematted, %d unchanged, %d failed",
+            self.directory,
+            len(summary["uploaded"]),
+            len(summary["deleted"]),
+            len(summary["rematted"]),
+            summary["unchanged"],
+            len(summary["failed"]),
+        )
+        return summary
+
+    def _scan(
+        self,
+    ) -> Tuple[Dict[str, Tuple[int, float]], Dict[str, Dict[str, Any]]]:
+        files = {}
+        for root, dirs, filenames in os.walk(self.directory):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for filename in filenames:
+                if filename.startswith(".") or not filename.lower().endswith(
+                    self.extensions
+                ):
+                    continue
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                name = os.path.relpath(path, self.directory)
+                files[name] = (stat.st_size, stat.st_mtime)
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        except (OSError, ValueError) as e:
+            _LOGGING.debug("Unable to read manifest %s: %s", self.manifest_path, e)
+            manifest = {}
+        return files, manifest
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.manifest_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            _LOGGING.debug("Unable to write manifest %s", self.manifest_path)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
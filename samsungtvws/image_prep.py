@@ -0,0 +1,109 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import io
+import logging
+import multiprocessing
+from typing import Optional, Tuple, Union
+
+from .async_upload import UploadSource
+
+_LOGGING = logging.getLogger(__name__)
+
+PANEL_SIZE = (3840, 2160)
+DEFAULT_QUALITY = 90
+
+
+def prepare_image(
+    image: Union[str, bytes],
+    panel_size: Tuple[int, int] = PANEL_SIZE,
+    quality: int = DEFAULT_QUALITY,
+) -> bytes:
+    """
+    Auto-orient image from its EXIF data, fit it to the panel resolution and
+    re-encode it as JPEG. Portrait images are fitted to the panel on its side
+    so they keep full resolution behind a portrait matte or on a rotated
+    panel. Images that are already JPEG, upright and small enough are returned
+    unchanged. Needs Pillow; runs in a worker process.
+    """
+    from PIL import Image, ImageOps
+
+    data = None
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        data = bytes(image)
+        image = io.BytesIO(data)
+    with Image.open(image) as original:
+        source_format = original.format
+        # exif_transpose always returns a copy, so check the orientation tag
+        upright = original.getexif().get(0x0112, 1) in (None, 1)
+        picture = original if upright else ImageOps.exif_transpose(original)
+        width, height = panel_size
+        if picture.height > picture.width:
+            width, height = height, width
+        resize = picture.width > width or picture.height > height
+        if not resize and upright and source_format == "JPEG":
+            if data is None:
+                with open(image, "rb") as f:
+                    data = f.read()
+            return data
+        if resize:
+            picture.thumbnail((width, height), Image.LANCZOS)
+        if picture.mode != "RGB":
+            picture = picture.convert("RGB")
+        output = io.BytesIO()
+        picture.save(output, "JPEG", quality=quality, optimize=True)
+        return output.getvalue()
+
+
+class ImagePreprocessor:
+    """
+    Resize and re-encode images to panel resolution before upload, in a
+    process pool so decoding large photos never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        panel_size: Tuple[int, int] = PANEL_SIZE,
+        quality: int = DEFAULT_QUALITY,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.panel_size = panel_size
+        self.quality = quality
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def process(self, source: UploadSource) -> UploadSource:
+        """Return a new UploadSource with the prepared JPEG."""
+        image: Union[str, bytes]
+        if source.path:
+            image = source.path
+        else:
+            image = b"".join([bytes(chunk) async for chunk in source.chunks()])
+        if self._executor is None:
+            # fork is unsafe in a multi-threaded process such as Home Assistant
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        data = await asyncio.get_running_loop().run_in_executor(
+            self._executor, prepare_image, image, self.panel_size, self.quality
+        )
+        _LOGGING.debug(
+            "Prepared %s for upload: %s -> %d bytes",
+            source.name,
+            source.file_size,
+            len(data),
+        )
+        return UploadSource(data, "jpg")
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -11,9 +11,11 @@ import time
 from typing import Any, Dict, List, Optional, Union
 import warnings
 
+import websocket
+
 from samsungtvws.event import ED_INSTALLED_APP_EVENT, parse_installed_app
 
-from . import art, connection, helper, rest, shortcuts
+from . import art, connection, exceptions, helper, rest, shortcuts
 from .command import SamsungTVCommand, SamsungTVSleepCommand
 
 _LOGGING = logging.getLogger(__name__)
@@ -226,7 +228,12 @@ class SamsungTVWS(connection.SamsungTVWSConnection):
         timeout: Optional[float] = None,
         key_press_delay: float = 1,
         name: str = "SamsungTvRemote",
+        eager: bool = False,
     ) -> None:
+        """
+        Construction does no I/O; model detection and token bootstrap happen
+        on first open() or in warm_up() (called here when eager is True)
+        """
         super().__init__(
             host,
             endpoint=REMOTE_ENDPOINT,
@@ -239,7 +246,31 @@ class SamsungTVWS(connection.SamsungTVWSConnection):
         )
         self._rest_api: Optional[rest.SamsungTVRest] = None
         self._app_list: Optional[List[Dict[str, Any]]] = None
-        year = self._get_rest_api().get_model_year()
+        self._model_year: Optional[int] = None
+        self._warmed_up = False
+        if eager:
+            self.warm_up()
+
+    @property
+    def model_year(self) -> int:
+        """Two digit model year from the REST api, fetched on first use."""
+        if self._model_year is None:
+            self._model_year = self._get_rest_api().get_model_year()
+        return self._model_year
+
+    def warm_up(self) -> None:
+        """
+        Detect the model and, on 2024+ TV's without a token, pair now so the
+        token is stored before the first command is sent
+        """
+        # Only try once, an unreachable TV must not cost a REST timeout on every
+        # open(); the websocket handshake still stores the token when pairing
+        self._warmed_up = True
+        try:
+            year = self.model_year
+        except exceptions.HttpApiError:
+            _LOGGING.debug("Unable to get model year of %s - may be off?", self.host)
+            return
         if not self.token:
             self.token = self._get_token()
         if not self.token and year >= 24:   #initialize token now for 2024+ tv's
@@ -247,7 +278,17 @@ class SamsungTVWS(connection.SamsungTVWSConnection):
                 self.open()
                 self.close()
             except Exception as e:
-                _LOGGING.debug('Unable to connect to {} - may be off?'.format(host))
+                _LOGGING.debug('Unable to connect to {} - may be off?'.format(self.host))
+
+    def open(self) -> websocket.WebSocket:
+        if not self._warmed_up:
+            self.warm_up()
+        return super().open()
+
+    def close(self) -> None:
+        super().close()
+        if self._rest_api:
+            self._rest_api.close()
 
     def _ws_send(
         self,
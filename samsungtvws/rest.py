@@ -15,6 +15,9 @@ from . import connection, exceptions, helper
 
 _LOGGING = logging.getLogger(__name__)
 
+# Device document fields that never change for a given TV
+DEVICE_FACTS = ("model", "modelName", "FrameTVSupport", "id", "wifiMac")
+
 
 class SamsungTVRest(connection.SamsungTVWSBaseConnection):
     def __init__(
@@ -22,6 +25,7 @@ class SamsungTVRest(connection.SamsungTVWSBaseConnection):
         host: str,
         port: int = 8001,
         timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         super().__init__(
             host,
@@ -29,35 +33,54 @@ class SamsungTVRest(connection.SamsungTVWSBaseConnection):
             port=port,
             timeout=timeout,
         )
+        # A session keeps the connection (and TLS on 8002) alive between calls
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+        self._device_facts: Optional[Dict[str, Any]] = None
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
 
     def _rest_request(self, target: str, method: str = "GET") -> Dict[str, Any]:
         url = self._format_rest_url(target)
         try:
-            if method == "POST":
-                response = requests.post(url, timeout=self.timeout, verify=False)
-            elif method == "PUT":
-                response = requests.put(url, timeout=self.timeout, verify=False)
-            elif method == "DELETE":
-                response = requests.delete(url, timeout=self.timeout, verify=False)
-            else:
-                response = requests.get(url, timeout=self.timeout, verify=False)
+            response = self.session.request(
+                method, url, timeout=self.timeout, verify=False
+            )
             return helper.process_api_response(response.text)
-        except requests.ConnectionError as err:
+        except (requests.ConnectionError, requests.Timeout) as err:
             raise exceptions.HttpApiError(
                 "TV unreachable or feature not supported on this model."
             ) from err
-            
+
     def rest_power_state(self) -> bool:
         _LOGGING.debug("Get PowerState via rest api")
-        return self._rest_request("").get('device', {}).get('PowerState', 'off') == 'on'
-        
+        device = self.rest_device_info().get("device", {})
+        return device.get("PowerState", "off") == "on"
+
+    def get_device_facts(self) -> Dict[str, Any]:
+        """Immutable device fields (DEVICE_FACTS), fetched once per client."""
+        if self._device_facts is None:
+            self.rest_device_info()
+        return self._device_facts or {}
+
     def get_model_year(self) -> int:
-        model = self._rest_request("").get('device', {}).get('model', '0_0')
-        return int(model.split('_')[0])
+        model = self.get_device_facts().get("model", "0_0")
+        return int(model.split("_")[0])
+
+    def rest_frame_tv_support(self) -> bool:
+        return self.get_device_facts().get("FrameTVSupport") == "true"
 
     def rest_device_info(self) -> Dict[str, Any]:
         _LOGGING.debug("Get device info via rest api")
-        return self._rest_request("")
+        data = self._rest_request("")
+        device = data.get("device")
+        if self._device_facts is None and device:
+            self._device_facts = {
+                fact: device[fact] for fact in DEVICE_FACTS if fact in device
+            }
+        return data
 
     def rest_app_status(self, app_id: str) -> Dict[str, Any]:
         _LOGGING.debug("Get app %s status via rest api", app_id)
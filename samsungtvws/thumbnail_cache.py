@@ -0,0 +1,132 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+from collections import OrderedDict
+import contextlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+_LOGGING = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """
+    On-disk artwork thumbnail cache keyed by content_id.
+
+    A content_id's thumbnail never changes, so entries only leave the cache
+    through LRU eviction once max_bytes is exceeded, or when the image is
+    deleted from the TV. Methods block on file I/O; async callers should run
+    them in an executor.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: Optional["OrderedDict[str, Tuple[str, int]]"] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> "OrderedDict[str, Tuple[str, int]]":
+        if self._entries is not None:
+            return self._entries
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        self._entries = OrderedDict()
+        self._size = 0
+        for _, filename, size in sorted(files):
+            self._entries[os.path.splitext(filename)[0]] = (filename, size)
+            self._size += size
+        _LOGGING.debug(
+            "Loaded %d cached thumbnails (%d bytes) from %s",
+            len(self._entries),
+            self._size,
+            self.directory,
+        )
+        return self._entries
+
+    def get(self, content_id: str) -> Optional[Tuple[str, bytes]]:
+        """Return (filename, data) for content_id, or None if not cached."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(content_id)
+            if entry is None:
+                return None
+            filename = entry[0]
+            path = os.path.join(self.directory, filename)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                self._forget(content_id)
+                return None
+            entries.move_to_end(content_id)
+            return filename, data
+
+    def put(self, filename: str, data: bytes) -> None:
+        """Store data under filename ('<content_id>.<type>'), evicting LRU entries."""
+        filename = os.path.basename(filename)
+        content_id = os.path.splitext(filename)[0]
+        with self._lock:
+            entries = self._load()
+            self._remove(content_id)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, os.path.join(self.directory, filename))
+            except OSError:
+                _LOGGING.debug("Unable to cache thumbnail %s", filename)
+                _unlink(tmp_path)
+                return
+            entries[content_id] = (filename, len(data))
+            self._size += len(data)
+            self._evict()
+
+    def invalidate(self, content_id: str) -> None:
+        with self._lock:
+            self._load()
+            self._remove(content_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            for content_id in list(self._load()):
+                self._remove(content_id)
+
+    def _evict(self) -> None:
+        entries = self._entries
+        while entries and self._size > self.max_bytes:
+            content_id = next(iter(entries))
+            _LOGGING.debug("Evicting cached thumbnail %s", content_id)
+            self._remove(content_id)
+
+    def _remove(self, content_id: str) -> None:
+        entry = self._forget(content_id)
+        if entry is not None:
+            _unlink(os.path.join(self.directory, entry[0]))
+
+    def _forget(self, content_id: str) -> Optional[Tuple[str, int]]:
+        assert self._entries is not None
+        entry = self._entries.pop(content_id, None)
+        if entry is not None:
+            self._size -= entry[1]
+        return entry
+
+
+def _unlink(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(path)
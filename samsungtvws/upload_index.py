@@ -0,0 +1,114 @@
+"""
+SamsungTVWS - Samsung Smart TV WS API wrapper
+
+Copyright (C) 2024 Jake Swent <jswent@mit.edu>
+
+SPDX-License-Identifier: LGPL-3.0
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from .async_upload import UploadSource
+
+_LOGGING = logging.getLogger(__name__)
+
+
+async def content_hash(source: UploadSource) -> Optional[str]:
+    """
+    sha256 of source's content, or None for sources that can only be read
+    once (file objects, async iterators)
+    """
+    if source.path is None and not isinstance(
+        source.file, (bytes, bytearray, memoryview)
+    ):
+        return None
+    digest = hashlib.sha256()
+    async for chunk in source.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadIndex:
+    """
+    Persistent map from image content hash to the content_id the TV gave it.
+
+    Both the raw file and the preprocessed image hash to the same content_id,
+    so a rerun finds the image whether or not it was resized. Entries are
+    dropped when the TV reports the image deleted, or is found not to have it
+    any more. Methods block on file I/O; async callers should run them in an
+    executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._hashes: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        if self._hashes is None:
+            try:
+                with open(self.path) as f:
+                    self._hashes = json.load(f)
+            except FileNotFoundError:
+                self._hashes = {}
+            except (OSError, ValueError) as e:
+                _LOGGING.debug("Unable to read upload index %s: %s", self.path, e)
+                self._hashes = {}
+        return self._hashes
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._hashes, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            _LOGGING.debug("Unable to write upload index %s", self.path)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    def get(self, digest: str) -> Optional[str]:
+        with self._lock:
+            return self._load().get(digest)
+
+    def add(self, digests: Iterable[Optional[str]], content_id: str) -> None:
+        with self._lock:
+            hashes = self._load()
+            changed = False
+            for digest in digests:
+                if digest and hashes.get(digest) != content_id:
+                    hashes[digest] = content_id
+                    changed = True
+            if changed:
+                self._save()
+
+    def discard(self, content_ids: Iterable[str]) -> None:
+        """Forget content_ids, eg after they were deleted from the TV."""
+        content_ids = set(content_ids)
+        self._retain(lambda content_id: content_id not in content_ids)
+
+    def reconcile(self, content_ids: Iterable[str]) -> None:
+        """Forget every content_id not in content_ids (the TV's content list)."""
+        content_ids = set(content_ids)
+        self._retain(lambda content_id: content_id in content_ids)
+
+    def _retain(self, keep: Callable[[str], bool]) -> None:
+        with self._lock:
+            hashes = self._load()
+            stale = [
+                digest for digest, content_id in hashes.items() if not keep(content_id)
+            ]
+            for digest in stale:
+                del hashes[digest]
+            if stale:
+                _LOGGING.debug("Dropped %d stale upload index entries", len(stale))
+                self._save()
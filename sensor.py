@@ -1,7 +1,8 @@
 import logging
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import FrameArtHub, DOMAIN
 from .const import SENSOR_TYPES, ENABLE_SENSOR
 
@@ -26,11 +27,12 @@ async def async_setup_entry(
         async_add_entities(sensors)
 
 
-class FrameArtSensor(SensorEntity):
+class FrameArtSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Frame Art sensor."""
 
     def __init__(self, hub: FrameArtHub, sensor_type: str, config: dict) -> None:
         """Initialize the sensor."""
+        super().__init__(hub.coordinator)
         self._hub = hub
         self._type = sensor_type
         self._attr_name = f"{hub.name} {config['name']}"
@@ -40,85 +42,38 @@ class FrameArtSensor(SensorEntity):
         self._attr_native_value = None
         self._attr_native_min_value = config.get("min")
         self._attr_native_max_value = config.get("max")
+        self._attr_available = False
         _LOGGER.debug("Setting up sensor %s for hub %s", self._type, self._hub.name)
+        self._update_from_snapshot()
 
-    async def async_update(self) -> None:
-        """Fetch the latest state of the sensor."""
-        _LOGGER.debug("Updating sensor %s for hub %s", self._type, self._hub.name)
+    @property
+    def available(self) -> bool:
+        """Return True if the sensor has a value from the TV."""
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a new state snapshot from the coordinator."""
+        self._update_from_snapshot()
+        super()._handle_coordinator_update()
 
-        # Check if TV is available
-        try:
-            is_alive = await self._hub.ex(self._hub._tv.is_alive)
-            self._attr_available = is_alive
-        except Exception as e:
-            _LOGGER.debug("Error checking TV availability: %s", str(e))
+    def _update_from_snapshot(self) -> None:
+        """Read this sensor's value from the shared state snapshot."""
+        _LOGGER.debug("Updating sensor %s for hub %s", self._type, self._hub.name)
+        snapshot = self.coordinator.data
+        if not snapshot or not snapshot["available"]:
             self._attr_available = False
             return
 
-        if not self._attr_available:
+        if self._type not in snapshot:
+            _LOGGER.warning("Unknown sensor type: %s", self._type)
+            self._attr_native_value = None
             return
 
-        try:
-            if self._type == "art_mode_status":
-                value = await self._hub.ex(self._hub._tv.get_artmode)
-                if value is None:
-                    self._attr_available = False
-                    return
-                self._attr_native_value = value
-
-            elif self._type == "brightness_level":
-                info = await self._hub.ex(self._hub._tv.get_brightness)
-                if info is None:
-                    self._attr_available = False
-                    return
-                try:
-                    value = int(info.get("value", 0))
-                    self._attr_native_value = value * 10
-                except (ValueError, TypeError):
-                    _LOGGER.warning("Could not parse brightness value from: %s", info)
-                    self._attr_native_value = 0
-
-            elif self._type == "connection_status":
-                self._attr_native_value = "Connected" if is_alive else "Disconnected"
-
-            elif self._type == "color_temperature":
-                info = await self._hub.ex(self._hub._tv.get_color_temperature)
-                if info is None:
-                    self._attr_available = False
-                    return
-                try:
-                    value = int(info.get("value", 0))
-                    self._attr_native_value = value
-                except (ValueError, TypeError):
-                    _LOGGER.warning("Could not parse color temperature value from: %s", info)
-                    self._attr_native_value = 0
-
-            elif self._type == "slideshow_status":
-                info = await self._hub.ex(self._hub._tv.get_slideshow_status)
-                if info is None:
-                    self._attr_available = False
-                    return
-                value = info.get("value")
-                if value is None:
-                    self._attr_available = False
-                    return
-                self._attr_native_value = value
-
-            elif self._type == "current_image":
-                info = await self._hub.ex(self._hub._tv.get_current)
-                if info is None:
-                    self._attr_available = False
-                    return
-                value = info.get("content_id")
-                if value is None:
-                    self._attr_available = False
-                    return
-                self._attr_native_value = value
-                    
-            else:
-                _LOGGER.warning("Unknown sensor type: %s", self._type)
-                self._attr_native_value = None
-
-        except Exception as e:
-            _LOGGER.error("Error updating %s sensor: %s", self._type, str(e))
+        value = snapshot[self._type]
+        if value is None:
             self._attr_available = False
+            return
+
+        self._attr_available = True
+        self._attr_native_value = value
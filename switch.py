@@ -2,7 +2,8 @@ import logging
 from typing import List
 from functools import partial
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.config_entries import ConfigEntry
 
@@ -25,15 +26,17 @@ async def async_setup_entry(
     async_add_entities(switches)
 
 
-class ArtSwitch(SwitchEntity):
+class ArtSwitch(CoordinatorEntity, SwitchEntity):
     """Representation of an art mode switch."""
 
     def __init__(self, hub: FrameArtHub) -> None:
         """Initialize the switch."""
+        super().__init__(hub.coordinator)
         self._hub = hub
         self._attr_name = f"{hub.name} Art Mode"
         self._attr_unique_id = f"{hub.host}_art_mode".replace(".", "_")
-        self._attr_is_on = False
+        snapshot = hub.coordinator.data or {}
+        self._attr_is_on = snapshot.get("art_mode_status") == "on"
 
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
@@ -49,8 +52,10 @@ class ArtSwitch(SwitchEntity):
         self._attr_is_on = False
         self.async_write_ha_state()
 
-    async def async_update(self):
-        """Update the switch state."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the switch state from the shared state snapshot."""
         _LOGGER.debug("Updating art mode status for %s", self._hub.name)
-        status = await self._hub.ex(self._hub._tv.get_artmode)
-        self._attr_is_on = status == "on"
\ No newline at end of file
+        snapshot = self.coordinator.data or {}
+        self._attr_is_on = snapshot.get("art_mode_status") == "on"
+        super()._handle_coordinator_update()